@@ -11,7 +11,7 @@ from .tts import (
     test_tts,
     speak_async
 )
-from .math_reader import solve_math_problem, read_formula, preprocess_math_expression
+from .math_reader import solve_math_problem, solve_math_problem_vectorized, read_formula, preprocess_math_expression
 from .desktop_control import (
     open_app,
     open_website,
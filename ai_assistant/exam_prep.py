@@ -4,12 +4,37 @@ Quiz generation, practice exams, time management, accessible strategies
 """
 
 import random
+import io
 import json
 import os
+import sys
+import threading
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import ai_assistant.tts as tts
 
+# Optional compression for archived quiz results
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Optional fast bulk sampling for simulated quiz runs
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Individual result files are kept for this many days, then archived by month
+ROTATE_DAYS = 90
+# Check for files to archive once every N saved results
+ROTATE_CHECK_INTERVAL = 100
+
+# Shared, immutable placeholders reused by every generated question
+_MULTIPLE_CHOICE_OPTIONS = ('Option A', 'Option B', 'Option C', 'Option D')
+_SHORT_ANSWER_KEY_POINTS = ('Point 1', 'Point 2', 'Point 3')
+_POINTS_BY_DIFFICULTY = {'easy': 1, 'medium': 2, 'hard': 3}
+
 class ExamPrepSystem:
     """Comprehensive exam preparation and practice system"""
     
@@ -23,10 +48,19 @@ class ExamPrepSystem:
         
         self.question_types = ['multiple_choice', 'true_false', 'short_answer', 'essay']
         self.difficulty_levels = ['easy', 'medium', 'hard']
+        
+        # Saved results since the last archive check (0 = check on the next save)
+        self._saves_since_rotation = 0
+        
+        # Random generator for simulated answers
+        self._rng = np.random.default_rng() if np is not None else random.Random()
     
     def generate_quiz(self, subject: str, topic: str, num_questions: int = 10,
                      difficulty: str = 'medium', question_type: str = 'multiple_choice') -> Dict:
         """Generate practice quiz from course materials"""
+        difficulty = sys.intern(difficulty)
+        question_type = sys.intern(question_type)
+        
         quiz = {
             'id': f"quiz_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             'subject': subject,
@@ -38,9 +72,13 @@ class ExamPrepSystem:
             'time_limit': num_questions * 2,  # 2 minutes per question
         }
         
+        # Text that is the same for every question in this quiz is built once
+        prompt_prefix = f"Sample {difficulty} question about {topic} in {subject}"
+        
         # Generate questions (simulated - would use AI/knowledge base in production)
         for i in range(num_questions):
-            question = self._generate_question(subject, topic, i+1, difficulty, question_type)
+            question = self._generate_question(subject, topic, i+1, difficulty, question_type,
+                                               prompt_prefix)
             quiz['questions'].append(question)
         
         # Save quiz
@@ -51,17 +89,20 @@ class ExamPrepSystem:
         return quiz
     
     def _generate_question(self, subject: str, topic: str, number: int,
-                          difficulty: str, q_type: str) -> Dict:
+                          difficulty: str, q_type: str,
+                          prompt_prefix: Optional[str] = None) -> Dict:
         """Generate a single question"""
         if q_type == 'multiple_choice':
+            if prompt_prefix is None:
+                prompt_prefix = f"Sample {difficulty} question about {topic} in {subject}"
             return {
                 'number': number,
                 'type': 'multiple_choice',
-                'question': f"Sample {difficulty} question about {topic} in {subject}?",
-                'options': ['Option A', 'Option B', 'Option C', 'Option D'],
+                'question': prompt_prefix + "?",
+                'options': _MULTIPLE_CHOICE_OPTIONS,
                 'correct_answer': 'Option A',
                 'explanation': 'Explanation of why Option A is correct.',
-                'points': 1 if difficulty == 'easy' else 2 if difficulty == 'medium' else 3,
+                'points': _POINTS_BY_DIFFICULTY.get(difficulty, 3),
             }
         
         elif q_type == 'true_false':
@@ -79,7 +120,7 @@ class ExamPrepSystem:
                 'number': number,
                 'type': 'short_answer',
                 'question': f"Explain {topic} in {subject}.",
-                'key_points': ['Point 1', 'Point 2', 'Point 3'],
+                'key_points': _SHORT_ANSWER_KEY_POINTS,
                 'sample_answer': 'Sample answer explaining the topic...',
                 'points': 5,
             }
@@ -157,6 +198,37 @@ class ExamPrepSystem:
         # For now, return simulated answer
         return random.choice(question['options'])
     
+    def _simulate_answers_bulk(self, quizzes: List[Dict]) -> List[List[Optional[str]]]:
+        """
+        Simulate answers for many quizzes at once (offline evaluation, self-tests)
+        Returns one list per quiz with a chosen option per multiple choice question
+        and None for other question types
+        """
+        total_questions = sum(len(quiz['questions']) for quiz in quizzes)
+        
+        # Draw every choice in one call; generated questions have four options,
+        # and a pick wraps around for any question with a different number
+        choices = len(_MULTIPLE_CHOICE_OPTIONS)
+        if np is not None:
+            picks = self._rng.integers(0, choices, size=total_questions).tolist()
+        else:
+            picks = [self._rng.randrange(choices) for _ in range(total_questions)]
+        
+        answers = []
+        position = 0
+        for quiz in quizzes:
+            quiz_answers = []
+            for question in quiz['questions']:
+                if question['type'] == 'multiple_choice':
+                    options = question['options']
+                    quiz_answers.append(options[picks[position] % len(options)])
+                else:
+                    quiz_answers.append(None)
+                position += 1
+            answers.append(quiz_answers)
+        
+        return answers
+    
     def _save_results(self, results: Dict):
         """Save quiz results for progress tracking"""
         results_file = os.path.join(
@@ -166,6 +238,85 @@ class ExamPrepSystem:
         
         with open(results_file, 'w', encoding='utf-8') as f:
             json.dump(results, f, indent=2)
+        
+        # Keep the progress directory bounded by archiving old results now and then
+        if self._saves_since_rotation % ROTATE_CHECK_INTERVAL == 0:
+            try:
+                self._rotate_progress_files()
+            except Exception as e:
+                print(f"[ExamPrep] Could not archive old results: {e}")
+        self._saves_since_rotation += 1
+    
+    def _archive_path(self, month: str) -> str:
+        """Path of the monthly archive for results started in month (YYYYMM)"""
+        extension = '.jsonl.zst' if zstandard is not None else '.jsonl'
+        return os.path.join(self.progress_dir, f"progress_{month}{extension}")
+    
+    def _rotate_progress_files(self, rotate_days: int = ROTATE_DAYS) -> int:
+        """Move result files older than rotate_days into monthly JSONL archives"""
+        cutoff = datetime.now() - timedelta(days=rotate_days)
+        cutoff_ts = cutoff.timestamp()
+        by_month = {}
+        
+        with os.scandir(self.progress_dir) as entries:
+            for entry in entries:
+                # Cheap mtime pre-filter so recent files are never opened
+                if not entry.name.endswith('.json') or entry.stat().st_mtime >= cutoff_ts:
+                    continue
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        result = json.load(f)
+                    started_at = datetime.fromisoformat(result['started_at'])
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    # Leave unreadable or foreign files where they are, so the
+                    # rest still rotate now and on later checks
+                    print(f"[ExamPrep] Not archiving {entry.name}: {e}")
+                    continue
+                if started_at >= cutoff:
+                    continue
+                month = started_at.strftime('%Y%m')
+                by_month.setdefault(month, []).append((entry.path, result))
+        
+        archived = 0
+        for month, items in by_month.items():
+            lines = ''.join(json.dumps(result) + '\n' for _, result in items)
+            if zstandard is not None:
+                # Each append adds a complete zstd frame; readers decode frames back to back
+                with zstandard.open(self._archive_path(month), 'ab') as f:
+                    f.write(lines.encode('utf-8'))
+            else:
+                with open(self._archive_path(month), 'a', encoding='utf-8') as f:
+                    f.write(lines)
+            for path, _ in items:
+                os.remove(path)
+            archived += len(items)
+        
+        return archived
+    
+    def _iter_archived_results(self, cutoff_date: datetime):
+        """Stream results from monthly archives that may contain entries after cutoff_date"""
+        first_month = cutoff_date.strftime('%Y%m')
+        with os.scandir(self.progress_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.startswith('progress_'))
+        
+        for name in names:
+            month = name[len('progress_'):len('progress_') + 6]
+            if month < first_month:
+                continue
+            path = os.path.join(self.progress_dir, name)
+            if name.endswith('.zst'):
+                if zstandard is None:
+                    print(f"[ExamPrep] Skipping {name}: zstandard is not installed")
+                    continue
+                reader = zstandard.ZstdDecompressor().stream_reader(
+                    open(path, 'rb'), read_across_frames=True, closefd=True)
+                f = io.TextIOWrapper(reader, encoding='utf-8')
+            else:
+                f = open(path, 'r', encoding='utf-8')
+            with f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
     
     def get_progress_report(self, subject: Optional[str] = None,
                            days: int = 30) -> Dict:
@@ -185,6 +336,14 @@ class ExamPrepSystem:
                         if subject is None or result.get('subject') == subject:
                             all_results.append(result)
         
+        # Results older than the rotation window only live in the monthly archives
+        if days > ROTATE_DAYS:
+            for result in self._iter_archived_results(cutoff_date):
+                result_date = datetime.fromisoformat(result['started_at'])
+                if result_date >= cutoff_date:
+                    if subject is None or result.get('subject') == subject:
+                        all_results.append(result)
+        
         # Calculate statistics
         if not all_results:
             return {'message': 'No quiz data available'}
@@ -354,12 +513,16 @@ class ExamPrepSystem:
 
 # Global instance
 _exam_prep = None
+_exam_prep_lock = threading.Lock()
 
 def get_exam_prep():
-    """Get or create exam prep system"""
+    """Get or create exam prep system (safe to call from several threads)"""
     global _exam_prep
     if _exam_prep is None:
-        _exam_prep = ExamPrepSystem()
+        with _exam_prep_lock:
+            # Another thread may have created it while we waited for the lock
+            if _exam_prep is None:
+                _exam_prep = ExamPrepSystem()
     return _exam_prep
 
 def generate_quiz(subject: str, topic: str, num_questions: int = 10) -> Dict:
@@ -7,6 +7,7 @@ import requests
 import json
 import logging
 import time
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 from bs4 import BeautifulSoup
 import re
@@ -33,6 +34,7 @@ class GoogleSearchManager:
         # Search settings
         self.max_results = 5
         self.search_delay = 1  # Delay between searches to be respectful
+        self.wikipedia_cache_ttl = 24 * 60 * 60  # Seconds before a cached page is revalidated
         
         # Set up logging
         logging.basicConfig(level=logging.INFO)
@@ -264,9 +266,28 @@ class GoogleSearchManager:
         return result
 
     def _extract_wikipedia_content(self, url: str) -> Optional[str]:
-        """Extract content from Wikipedia page"""
+        """
+        Extract content from Wikipedia page
+        Pages are cached with their ETag: fresh entries are returned directly and
+        stale ones are revalidated with If-None-Match, so unchanged pages skip the parse
+        """
         try:
-            response = self.session.get(url, timeout=10)
+            cache_key = f"wikipedia page {url}"
+            cached = self.offline_data.get_search_cache(cache_key)
+            headers = {}
+            if cached:
+                age = time.time() - datetime.fromisoformat(cached['timestamp']).timestamp()
+                if age < self.wikipedia_cache_ttl:
+                    return cached['response']
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+            
+            response = self.session.get(url, timeout=10, headers=headers)
+            if response.status_code == 304 and cached:
+                # Unchanged upstream: refresh the cache timestamp and reuse the stored text
+                self.offline_data.cache_online_search(cache_key, cached['response'], "wikipedia_page",
+                                                      etag=cached['etag'])
+                return cached['response']
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -283,7 +304,10 @@ class GoogleSearchManager:
                         content_parts.append(text)
                 
                 if content_parts:
-                    return "\n\n".join(content_parts)
+                    content = "\n\n".join(content_parts)
+                    self.offline_data.cache_online_search(cache_key, content, "wikipedia_page",
+                                                          etag=response.headers.get('ETag', ''))
+                    return content
             
             return None
             
@@ -5,161 +5,298 @@ from .offline_academic import get_mode, set_mode
 import math
 import os
 import ast
+import functools
+import keyword
 import operator
+import re
+import types
 
-# Load environment variables from .env file (optional)
+# Optional accelerators for evaluating one expression over many values
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import numpy as np
 except ImportError:
-    # dotenv not available, environment variables won't be loaded from .env file
-    pass
+    np = None
 
-def safe_eval_math(expression, allowed_names):
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# WolframAlpha and .env settings are only needed for online mode, so they
+# are loaded on the first online query
+wolframalpha = None
+_online_loaded = False
+
+# (app_id, client) reused by solve_online_math
+_WA_CLIENT = None
+
+# Spoken error feedback (TTS integration point), resolved once
+try:
+    from .tts import speak_text as _speak_text
+except Exception:
+    _speak_text = None
+
+# Supported operators for mathematical expressions
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+# Names offline expressions may use (math module plus a few safe builtins)
+_ALLOWED_NAMES = {k: v for k, v in math.__dict__.items() if not k.startswith("__")}
+_ALLOWED_NAMES.update({
+    'abs': abs, 'round': round, 'min': min, 'max': max,
+    'sum': sum, 'pow': pow, 'divmod': divmod
+})
+_ALLOWED_NAMES = types.MappingProxyType(_ALLOWED_NAMES)
+
+# Element-wise numpy equivalents of the allowed names, for batch evaluation
+_NUMPY_NAMES = {}
+if np is not None:
+    for _name, _value in _ALLOWED_NAMES.items():
+        if isinstance(_value, float):
+            _NUMPY_NAMES[_name] = _value
+        elif isinstance(getattr(np, _name, None), np.ufunc):
+            _NUMPY_NAMES[_name] = getattr(np, _name)
+
+# Globals for compiled expressions: no builtins. Expression code never stores
+# globals, so one shared dict is safe
+_EVAL_GLOBALS = {'__builtins__': {}}
+
+@functools.singledispatch
+def _validate_node(node, names, functions):
     """
-    Safely evaluate mathematical expressions without using eval()
-    Uses AST parsing to prevent code injection attacks
+    Check a parsed expression against the whitelist of node types and operators
+    Names and called functions are collected so they can be checked per call
     """
-    # Supported operators for mathematical expressions
-    operators = {
-        ast.Add: operator.add,
-        ast.Sub: operator.sub,
-        ast.Mult: operator.mul,
-        ast.Div: operator.truediv,
-        ast.FloorDiv: operator.floordiv,
-        ast.Mod: operator.mod,
-        ast.Pow: operator.pow,
-        ast.USub: operator.neg,
-        ast.UAdd: operator.pos,
-    }
-    
-    def eval_node(node):
-        if isinstance(node, ast.Num):  # Numbers (deprecated in Python 3.8+)
-            return node.n
-        elif isinstance(node, ast.Constant):  # Numbers in Python 3.8+
-            return node.value
-        elif isinstance(node, ast.Name):  # Variables/functions
-            if node.id in allowed_names:
-                return allowed_names[node.id]
-            else:
-                raise ValueError(f"Name '{node.id}' is not allowed")
-        elif isinstance(node, ast.BinOp):  # Binary operations
-            left = eval_node(node.left)
-            right = eval_node(node.right)
-            op = operators.get(type(node.op))
-            if op:
-                return op(left, right)
-            else:
-                raise ValueError(f"Operator {type(node.op).__name__} not supported")
-        elif isinstance(node, ast.UnaryOp):  # Unary operations
-            operand = eval_node(node.operand)
-            op = operators.get(type(node.op))
-            if op:
-                return op(operand)
-            else:
-                raise ValueError(f"Unary operator {type(node.op).__name__} not supported")
-        elif isinstance(node, ast.Call):  # Function calls
-            func_name = node.func.id if isinstance(node.func, ast.Name) else None
-            if func_name and func_name in allowed_names:
-                func = allowed_names[func_name]
-                args = [eval_node(arg) for arg in node.args]
-                return func(*args)
-            else:
-                raise ValueError(f"Function '{func_name}' is not allowed")
-        else:
-            raise ValueError(f"Node type {type(node).__name__} not supported")
+    raise ValueError(f"Node type {type(node).__name__} not supported")
+
+@_validate_node.register(ast.Constant)  # Numbers
+def _(node, names, functions):
+    return
+
+@_validate_node.register(ast.Name)  # Variables/functions
+def _(node, names, functions):
+    names.add(node.id)
+
+@_validate_node.register(ast.BinOp)  # Binary operations
+def _(node, names, functions):
+    if type(node.op) not in _OPERATORS:
+        raise ValueError(f"Operator {type(node.op).__name__} not supported")
+    _validate_node(node.left, names, functions)
+    _validate_node(node.right, names, functions)
+
+@_validate_node.register(ast.UnaryOp)  # Unary operations
+def _(node, names, functions):
+    if type(node.op) not in _OPERATORS:
+        raise ValueError(f"Unary operator {type(node.op).__name__} not supported")
+    _validate_node(node.operand, names, functions)
+
+@_validate_node.register(ast.Call)  # Function calls
+def _(node, names, functions):
+    if not isinstance(node.func, ast.Name):
+        raise ValueError("Function 'None' is not allowed")
+    functions.add(node.func.id)
+    for arg in node.args:
+        _validate_node(arg, names, functions)
+    for keyword in node.keywords:
+        if keyword.arg is None:
+            raise ValueError("Keyword unpacking is not supported")
+        _validate_node(keyword.value, names, functions)
+
+@functools.lru_cache(maxsize=512)
+def _compile_cached(expression):
+    """
+    Parse, validate and compile an expression once
+    Returns the code object with the names and functions it needs
     
+    The code object is already a flat post-order stack program (with constants
+    folded by the compiler) run by CPython's own VM, so no separate opcode
+    interpreter is needed here
+    """
+    tree = ast.parse(expression, mode='eval')
+    names, functions = set(), set()
+    _validate_node(tree.body, names, functions)
+    code = compile(tree, '<mathexpr>', 'eval')
+    return code, frozenset(names), frozenset(functions)
+
+@functools.lru_cache(maxsize=512)
+def _syntax_error(expression):
+    """
+    Message of the SyntaxError an expression raises, or None if it parses
+    Cached so bad input isn't reparsed on every attempt
+    """
     try:
-        # Parse the expression into an AST
-        tree = ast.parse(expression, mode='eval')
-        return eval_node(tree.body)
+        _compile_cached(expression)
     except SyntaxError as e:
-        raise ValueError(f"Invalid mathematical expression: {e}")
-    except Exception as e:
-        raise ValueError(f"Error evaluating expression: {e}")
+        return str(e)
+    except ValueError:
+        # Whitelist failures are reported when the expression is evaluated
+        pass
+    return None
 
-def preprocess_math_expression(problem):
-    """Enhanced preprocessing for natural language math expressions"""
-    # Convert common math terms to Python syntax
-    replacements = {
-        # Basic operations
-        ' plus ': '+', ' add ': '+', ' and ': '+',
-        ' minus ': '-', ' subtract ': '-', ' less ': '-', ' take away ': '-',
-        ' times ': '*', ' multiply ': '*', ' multiplied by ': '*', ' of ': '*',
-        ' divided by ': '/', ' divide ': '/', ' over ': '/', ' per ': '/',
-        ' to the power of ': '**', ' raised to ': '**', '^': '**', ' to the ': '**',
-        ' squared': '**2', ' cubed': '**3', ' to the fourth': '**4', ' to the fifth': '**5',
-        
-        # Common symbols and alternatives
-        'x': '*', 'X': '*', '÷': '/', '×': '*', '·': '*',
-        ' mod ': '%', ' modulo ': '%', ' remainder ': '%',
-        
-        # Numbers in words (extended)
-        ' zero ': '0', ' one ': '1', ' two ': '2', ' three ': '3',
-        ' four ': '4', ' five ': '5', ' six ': '6', ' seven ': '7',
-        ' eight ': '8', ' nine ': '9', ' ten ': '10', ' eleven ': '11',
-        ' twelve ': '12', ' thirteen ': '13', ' fourteen ': '14', ' fifteen ': '15',
-        ' sixteen ': '16', ' seventeen ': '17', ' eighteen ': '18', ' nineteen ': '19',
-        ' twenty ': '20', ' thirty ': '30', ' forty ': '40', ' fifty ': '50',
-        ' sixty ': '60', ' seventy ': '70', ' eighty ': '80', ' ninety ': '90',
-        ' hundred ': '100', ' thousand ': '1000',
-        
-        # Mathematical functions (extended)
-        ' square root of ': 'sqrt(', ' sqrt ': 'sqrt(', ' root ': 'sqrt(',
-        ' absolute value of ': 'abs(', ' abs ': 'abs(',
-        ' sine of ': 'sin(', ' sin ': 'sin(', ' cosine of ': 'cos(', ' cos ': 'cos(',
-        ' tangent of ': 'tan(', ' tan ': 'tan(',
-        ' log ': 'log(', ' ln ': 'log(', ' logarithm of ': 'log(',
-        ' natural log of ': 'log(', ' log base 10 of ': 'log10(',
-        ' exponential ': 'exp(', ' exp ': 'exp(',
+def safe_eval_math(expression, allowed_names):
+    """
+    Safely evaluate mathematical expressions without using eval() on raw input
+    The AST is whitelist-validated before it is compiled, and the compiled code
+    runs without builtins, seeing only allowed_names
+    """
+    try:
+        error = _syntax_error(expression)
+    except TypeError as e:  # Unhashable or not a string
+        raise ValueError(f"Error evaluating expression: {e}")
+    if error is not None:
+        raise ValueError(f"Invalid mathematical expression: {error}")
+    
+    try:
+        # Parse, validate and compile (cached per expression string)
+        code, names, functions = _compile_cached(expression)
         
-        # Constants
-        ' pi ': 'pi', ' PI ': 'pi', ' euler ': 'e', ' eulers number ': 'e',
+        for name in functions:
+            if name not in allowed_names:
+                raise ValueError(f"Function '{name}' is not allowed")
+        for name in names:
+            if name not in allowed_names:
+                raise ValueError(f"Name '{name}' is not allowed")
         
-        # Percentage
-        ' percent': '/100', '%': '/100',
+        return eval(code, _EVAL_GLOBALS, allowed_names)
+    except Exception as e:
+        raise ValueError(f"Error evaluating expression: {e}")
+
+# Convert common math terms to Python syntax
+_REPLACEMENTS = {
+    # Basic operations
+    ' plus ': '+', ' add ': '+', ' and ': '+',
+    ' minus ': '-', ' subtract ': '-', ' less ': '-', ' take away ': '-',
+    ' times ': '*', ' multiply ': '*', ' multiplied by ': '*', ' of ': '*',
+    ' divided by ': '/', ' divide ': '/', ' over ': '/', ' per ': '/',
+    ' to the power of ': '**', ' raised to ': '**', '^': '**', ' to the ': '**',
+    ' squared': '**2', ' cubed': '**3', ' to the fourth': '**4', ' to the fifth': '**5',
+    
+    # Common symbols and alternatives
+    # 'x' as its own word, or between digits as in '5x3' (see _TOKEN_RX); never
+    # inside a word such as 'exp'
+    'x': '*', 'X': '*',
+    ' mod ': '%', ' modulo ': '%', ' remainder ': '%',
+    
+    # Numbers in words (extended)
+    ' zero ': '0', ' one ': '1', ' two ': '2', ' three ': '3',
+    ' four ': '4', ' five ': '5', ' six ': '6', ' seven ': '7',
+    ' eight ': '8', ' nine ': '9', ' ten ': '10', ' eleven ': '11',
+    ' twelve ': '12', ' thirteen ': '13', ' fourteen ': '14', ' fifteen ': '15',
+    ' sixteen ': '16', ' seventeen ': '17', ' eighteen ': '18', ' nineteen ': '19',
+    ' twenty ': '20', ' thirty ': '30', ' forty ': '40', ' fifty ': '50',
+    ' sixty ': '60', ' seventy ': '70', ' eighty ': '80', ' ninety ': '90',
+    ' hundred ': '100', ' thousand ': '1000',
+    
+    # Mathematical functions (extended)
+    ' square root of ': 'sqrt(', ' sqrt ': 'sqrt(', ' root ': 'sqrt(',
+    ' absolute value of ': 'abs(', ' abs ': 'abs(',
+    ' sine of ': 'sin(', ' sin ': 'sin(', ' cosine of ': 'cos(', ' cos ': 'cos(',
+    ' tangent of ': 'tan(', ' tan ': 'tan(',
+    ' log ': 'log(', ' ln ': 'log(', ' logarithm of ': 'log(',
+    ' natural log of ': 'log(', ' log base 10 of ': 'log10(',
+    ' exponential ': 'exp(', ' exp ': 'exp(',
+    
+    # Constants
+    ' pi ': 'pi', ' PI ': 'pi', ' euler ': 'e', ' eulers number ': 'e',
+    
+    # Percentage
+    ' percent': '/100', '%': '/100',
+    
+    # Common phrases
+    ' what is ': '', ' calculate ': '', ' solve ': '', ' find ': '',
+    ' equals ': '=', ' equal to ': '=', ' is ': '=',
+}
+
+# Input that is already plain arithmetic and can skip preprocessing
+_SIMPLE_NUMERIC_RX = re.compile(r'^[\d+\-*/().\s]+$', re.ASCII)
+
+# One-to-one symbol substitutions, applied in a single translate() pass
+_CHAR_TABLE = str.maketrans({'÷': '/', '×': '*', '·': '*'})
+
+# Phrase table keyed by word tuples, e.g. ('divided', 'by') -> '/'
+_PHRASES = {tuple(phrase.split()): text for phrase, text in _REPLACEMENTS.items()}
+_MAX_PHRASE_WORDS = max(len(words) for words in _PHRASES)
+
+# An 'x' between digits (the times sign in '5x3'), words (which may contain
+# digits, e.g. log10), numbers, then single symbols
+_TOKEN_RX = re.compile(r'(?<=\d)x(?=\d)|[a-z_][a-z_0-9]*|(?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?|\S')
+_OPERAND_RX = re.compile(r'[\w.]+')
+_QSTART_RX = re.compile(r'^(?:what is|how much is|calculate|solve|find)\s*', re.IGNORECASE)
+
+def _join_tokens(out, text):
+    """Append text, keeping a space only where two words or numbers would merge"""
+    if out and _OPERAND_RX.fullmatch(out[-1][-1]) and _OPERAND_RX.fullmatch(text[0]):
+        out.append(' ')
+    out.append(text)
+
+def _rewrite_tokens(tokens):
+    """
+    Single pass over the tokens: longest phrase match first, then emit
+    Functions opened by a phrase ("square root of" -> "sqrt(") are closed as
+    soon as one operand at their depth has been emitted. Paren depth is tracked
+    as tokens are emitted, so closing what's left needs no counting pass
+    """
+    out = []
+    depth = 0
+    open_calls = []  # Depths of calls opened by a phrase
+    i = 0
+    while i < len(tokens):
+        for size in range(min(_MAX_PHRASE_WORDS, len(tokens) - i), 0, -1):
+            text = _PHRASES.get(tuple(tokens[i:i + size]))
+            if text is not None:
+                break
+        else:
+            size, text = 1, tokens[i]
+        i += size
         
-        # Common phrases
-        ' what is ': '', ' calculate ': '', ' solve ': '', ' find ': '',
-        ' equals ': '=', ' equal to ': '=', ' is ': '=',
+        if text != '(' and text.endswith('('):
+            if i < len(tokens) and tokens[i] == '(':
+                text = text[:-1]  # Already written as a call: "sqrt(16)"
+            else:
+                _join_tokens(out, text)
+                depth += 1
+                open_calls.append(depth)
+                continue
+        if not text:
+            continue
         
-        # Clean up multiple spaces
-        '  ': ' ', '   ': ' '
-    }
+        _join_tokens(out, text)
+        if text == '(':
+            depth += 1
+            continue
+        if text == ')':
+            depth -= 1
+        elif not _OPERAND_RX.fullmatch(text):
+            continue
+        # An operand (or a closing paren) completes any calls waiting at this depth
+        while open_calls and open_calls[-1] == depth:
+            out.append(')')
+            open_calls.pop()
+            depth -= 1
     
+    if depth > 0:
+        out.append(')' * depth)
+    return ''.join(out)
+
+def preprocess_math_expression(problem):
+    """Enhanced preprocessing for natural language math expressions"""
     processed = problem.lower().strip()
     
     # Remove question words at the beginning
-    question_starters = ['what is', 'how much is', 'calculate', 'solve', 'find']
-    for starter in question_starters:
-        if processed.startswith(starter):
-            processed = processed[len(starter):].strip()
-    
-    # Apply replacements
-    for old, new in replacements.items():
-        processed = processed.replace(old, new)
+    processed = _QSTART_RX.sub('', processed, count=1)
     
-    # Handle parentheses for functions
-    functions_needing_close = ['sqrt(', 'abs(', 'sin(', 'cos(', 'tan(', 'log(', 'log10(', 'exp(']
-    for func in functions_needing_close:
-        if func in processed and processed.count('(') > processed.count(')'):
-            # Find the end of the function argument
-            func_pos = processed.find(func)
-            if func_pos != -1:
-                # Look for the next operator or end of string
-                search_start = func_pos + len(func)
-                operators = ['+', '-', '*', '/', ')', '=', ' ']
-                next_op_pos = len(processed)
-                for op in operators:
-                    op_pos = processed.find(op, search_start)
-                    if op_pos != -1 and op_pos < next_op_pos:
-                        next_op_pos = op_pos
-                
-                # Insert closing parenthesis
-                if next_op_pos < len(processed):
-                    processed = processed[:next_op_pos] + ')' + processed[next_op_pos:]
-                else:
-                    processed += ')'
+    # Rewrite phrases token by token, closing function calls as their argument ends
+    processed = processed.translate(_CHAR_TABLE)
+    processed = _rewrite_tokens(_TOKEN_RX.findall(processed))
     
     # Handle equations (convert = to a solvable format for simple cases)
     if '=' in processed and not any(op in processed for op in ['solve', 'factor', 'expand']):
@@ -179,6 +316,113 @@ def read_formula(formula):
     # For demo, just repeat the formula. For real use, integrate with MathPix or LaTeX parser.
     return f"The formula is: {formula}"
 
+@functools.lru_cache(maxsize=1024)
+def _eval_offline(preprocessed):
+    """
+    Evaluate a preprocessed expression and tidy the number for display
+    Math is pure, so results are memoized per expression string
+    """
+    # Use safe_eval instead of eval for security, allowing only safe math names
+    result = safe_eval_math(preprocessed, _ALLOWED_NAMES)
+    
+    # Format the result nicely
+    if isinstance(result, float):
+        if result.is_integer():
+            result = int(result)
+        else:
+            result = round(result, 6)  # Round to 6 decimal places
+    return result
+
+# Expressions seen once by solve_math_problem_vectorized; JIT on the next call
+_JIT_CANDIDATES = set()
+_JIT_CANDIDATES_MAX = 256
+# Expressions numba failed to compile or run; these always use numpy
+_JIT_FAILED = set()
+
+@functools.lru_cache(maxsize=64)
+def _numba_kernel(expression, var_name):
+    """
+    Build a numba ufunc evaluating expression element-wise over var_name
+    Compilation is lazy, on first call; None when numba is not installed or
+    the kernel's source does not compile
+    """
+    if numba is None:
+        return None
+    source = f"def _kernel({var_name}):\n    return {ast.unparse(ast.parse(expression, mode='eval'))}\n"
+    namespace = dict(_ALLOWED_NAMES)
+    namespace['__builtins__'] = {}
+    try:
+        exec(source, namespace)
+    except SyntaxError:
+        return None
+    return numba.vectorize(namespace['_kernel'])
+
+def solve_math_problem_vectorized(problem, var_name, xs):
+    """
+    Evaluate one expression for every value in xs, e.g. to plot "sin(x) + x**2"
+    problem uses Python syntax and var_name is the variable it ranges over
+    Returns a numpy array when numpy is installed (JIT-compiled with numba when
+    available), otherwise a list; points where the expression is undefined are nan
+    """
+    if not var_name.isidentifier() or keyword.iskeyword(var_name):
+        raise ValueError(f"Invalid variable name: {var_name}")
+    try:
+        code, names, functions = _compile_cached(problem)
+    except SyntaxError as e:
+        raise ValueError(f"Invalid mathematical expression: {e}")
+    for name in functions:
+        if name not in _ALLOWED_NAMES:
+            raise ValueError(f"Function '{name}' is not allowed")
+    for name in names:
+        if name != var_name and name not in _ALLOWED_NAMES:
+            raise ValueError(f"Name '{name}' is not allowed")
+    
+    values = list(xs)
+    if np is not None:
+        xs = np.asarray(values, dtype=float)
+        
+        # JIT compiling costs tens of milliseconds, so only do it for an
+        # expression that is evaluated again; the first batch runs on numpy
+        key = (problem, var_name)
+        kernel = None
+        if key in _JIT_CANDIDATES:
+            kernel = _numba_kernel(problem, var_name)
+        elif key not in _JIT_FAILED:
+            if len(_JIT_CANDIDATES) >= _JIT_CANDIDATES_MAX:
+                _JIT_CANDIDATES.clear()
+            _JIT_CANDIDATES.add(key)
+        if kernel is not None:
+            try:
+                return kernel(xs)
+            except Exception:
+                # Not supported in nopython mode. numba would retry the lazy
+                # compile on every call, so use numpy for this expression from now on
+                _JIT_CANDIDATES.discard(key)
+                if len(_JIT_FAILED) >= _JIT_CANDIDATES_MAX:
+                    _JIT_FAILED.clear()
+                _JIT_FAILED.add(key)
+        
+        if (names | functions) - {var_name} <= _NUMPY_NAMES.keys():
+            scope = dict(_NUMPY_NAMES)
+            scope[var_name] = xs
+            try:
+                with np.errstate(all='ignore'):
+                    result = eval(code, _EVAL_GLOBALS, scope)
+                return np.broadcast_to(np.asarray(result, dtype=float), xs.shape).copy()
+            except Exception:
+                pass  # e.g. two-argument log(); evaluate point by point below
+    
+    # Point-by-point evaluation with the scalar math functions
+    scope = dict(_ALLOWED_NAMES)
+    results = []
+    for x in values:
+        scope[var_name] = x
+        try:
+            results.append(float(eval(code, _EVAL_GLOBALS, scope)))
+        except (ArithmeticError, ValueError, TypeError):
+            results.append(float('nan'))
+    return np.array(results) if np is not None else results
+
 def solve_math_problem(problem, gui_callback=None):
     """
     Solve math problem using WolframAlpha if online, else use Python math module
@@ -189,30 +433,20 @@ def solve_math_problem(problem, gui_callback=None):
     
     if mode == 'offline':
         try:
-            # Enhanced preprocessing for natural language math
-            preprocessed = preprocess_math_expression(problem)
+            # Plain arithmetic needs no rewriting; everything else, including
+            # unbalanced parentheses left for it to close, gets the enhanced
+            # preprocessing for natural language math
+            if _SIMPLE_NUMERIC_RX.match(problem) and problem.count('(') == problem.count(')'):
+                preprocessed = problem.strip()
+            else:
+                preprocessed = preprocess_math_expression(problem)
             print(f"[Math] Preprocessed: {preprocessed}")
             
             # Handle special cases
             if 'solve(' in preprocessed:
                 return solve_simple_equation(preprocessed, problem)
             
-            # Only allow safe math expressions
-            allowed_names = {k: v for k, v in math.__dict__.items() if not k.startswith("__")}
-            allowed_names.update({
-                'abs': abs, 'round': round, 'min': min, 'max': max,
-                'sum': sum, 'pow': pow, 'divmod': divmod
-            })
-            
-            # Use safe_eval instead of eval for security
-            result = safe_eval_math(preprocessed, allowed_names)
-            
-            # Format the result nicely
-            if isinstance(result, float):
-                if result.is_integer():
-                    result = int(result)
-                else:
-                    result = round(result, 6)  # Round to 6 decimal places
+            result = _eval_offline(preprocessed)
             
             # Create detailed response
             response = f"Solution: {result}"
@@ -233,11 +467,11 @@ def solve_math_problem(problem, gui_callback=None):
                 return f"Unable to solve '{problem}' offline.\n\n{suggestions}\n\nTry switching to online mode for advanced calculations."
             
             # Speak the error (TTS integration point)
-            try:
-                from .tts import speak_text
-                speak_text(f"Sorry, could not solve the problem offline. {str(e)}")
-            except Exception:
-                pass
+            if _speak_text is not None:
+                try:
+                    _speak_text(f"Sorry, could not solve the problem offline. {str(e)}")
+                except Exception:
+                    pass
             
             return f"Unable to solve '{problem}' offline.\n\n{suggestions}"
     else:
@@ -261,16 +495,41 @@ def solve_simple_equation(preprocessed, original_problem):
     except Exception as e:
         return f"Error solving equation: {str(e)}"
 
+def _load_online_support():
+    """Load .env settings and import wolframalpha once; returns the module or None"""
+    global wolframalpha, _online_loaded
+    if not _online_loaded:
+        # Load environment variables from .env file (optional)
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            # dotenv not available, environment variables won't be loaded from .env file
+            pass
+        try:
+            import wolframalpha
+        except ImportError:
+            wolframalpha = None
+        _online_loaded = True
+    return wolframalpha
+
+def _get_wolfram_client(app_id):
+    """Return the WolframAlpha client for app_id, reusing it across calls"""
+    global _WA_CLIENT
+    if _WA_CLIENT is None or _WA_CLIENT[0] != app_id:
+        _WA_CLIENT = (app_id, wolframalpha.Client(app_id))
+    return _WA_CLIENT[1]
+
 def solve_online_math(problem):
     """Solve math using WolframAlpha online"""
     try:
-        import wolframalpha
+        if _load_online_support() is None:
+            raise ImportError("No module named 'wolframalpha'")
         app_id = os.getenv("WOLFRAMALPHA_APP_ID")
         if not app_id:
             return "WolframAlpha App ID not set. Please configure WOLFRAMALPHA_APP_ID environment variable for online math solving."
         
-        client = wolframalpha.Client(app_id)
-        res = client.query(problem)
+        res = _get_wolfram_client(app_id).query(problem)
         
         # Check if there are any results
         if hasattr(res, 'results') and res.results is not None:
@@ -288,11 +547,11 @@ def solve_online_math(problem):
         error_msg = f"Online calculation error: {str(e)}"
         print(f"[Math] {error_msg}")
         # Speak the error (TTS integration point)
-        try:
-            from .tts import speak_text
-            speak_text(f"Sorry, could not solve the problem online. {str(e)}")
-        except Exception:
-            pass
+        if _speak_text is not None:
+            try:
+                _speak_text(f"Sorry, could not solve the problem online. {str(e)}")
+            except Exception:
+                pass
         return f"Unable to solve '{problem}' online. Error: {str(e)}\n\nPlease check your internet connection or try simplifying the problem."
 
 # Helper functions for enhanced math solver
@@ -339,19 +598,28 @@ def get_math_examples():
         ]
     }
 
+# Keywords that point to problems needing online mode, by suggestion category
+_SUGGESTION_CATEGORIES = {
+    'solve': 'equation', 'equation': 'equation', '=': 'equation',
+    'derivative': 'calculus', 'integral': 'calculus', 'limit': 'calculus',
+    'factor': 'algebra', 'expand': 'algebra', 'polynomial': 'algebra',
+}
+_SUGGESTION_RX = re.compile('|'.join(re.escape(word) for word in _SUGGESTION_CATEGORIES))
+
 def get_math_suggestions(problem):
     """Get helpful suggestions based on the problem type"""
     suggestions = "Suggestions:\n"
+    categories = {_SUGGESTION_CATEGORIES[word] for word in _SUGGESTION_RX.findall(problem.lower())}
     
-    if any(word in problem.lower() for word in ['solve', 'equation', '=']):
+    if 'equation' in categories:
         suggestions += "• For equations, try online mode\n"
         suggestions += "• Simplify to basic arithmetic if possible\n"
     
-    if any(func in problem.lower() for func in ['derivative', 'integral', 'limit']):
+    if 'calculus' in categories:
         suggestions += "• Calculus requires online mode\n"
         suggestions += "• Try basic algebra instead\n"
     
-    if any(word in problem.lower() for word in ['factor', 'expand', 'polynomial']):
+    if 'algebra' in categories:
         suggestions += "• Algebraic manipulation requires online mode\n"
         suggestions += "• Try numerical calculations\n"
     
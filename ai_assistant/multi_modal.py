@@ -1,10 +1,21 @@
 """
 Multi-Modal Input Support module
 """
+import functools
+
+def _message(input_type):
+    """Placeholder message for input_type"""
+    return f"Multi-modal input processing not yet implemented for: {input_type}"
+
+# typed=True so equal values of different types (True, 1, 1.0) are not
+# served each other's message
+_cached_message = functools.lru_cache(maxsize=32, typed=True)(_message)
+
 def process_multimodal_input(input_type):
     """
     Process multi-modal input (text, voice, image, etc.)
-    Currently a placeholder for future implementation
+    Currently a placeholder for future implementation; the message only
+    depends on input_type, so it is cached when input_type is hashable
     
     Args:
         input_type (str): Type of input to process
@@ -12,4 +23,8 @@ def process_multimodal_input(input_type):
     Returns:
         str: Processing result message
     """
-    return f"Multi-modal input processing not yet implemented for: {input_type}"
+    try:
+        return _cached_message(input_type)
+    except TypeError:
+        # Unhashable input_type (e.g. a dict or list): format it uncached
+        return _message(input_type)
@@ -0,0 +1,240 @@
+"""
+Offline Academic Data Model
+Source of the offline academic content, split into one module per subject
+(basic/mathematics.py, secondary/science.py, ...) plus counselling.py. Each
+entry is a (text, reference) pair, where reference indexes the shared
+REFERENCES table. Subject modules are only imported when OFFLINE_DATA is
+indexed into, so looking up one subject does not parse the others.
+
+offline_academic works from the packed form produced by pack() and renders
+the full text on access, and searches a sqlite3 FTS5 index of the entries.
+It writes both to this package's __pycache__ the first time it needs them,
+and only imports the data modules again after they change. To build ahead
+of time (e.g. before installing read-only), run:
+
+    python -m ai_assistant.offline_academic_data
+"""
+import functools
+import importlib
+import marshal
+import os
+import sqlite3
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from .references import REFERENCES
+
+# Subjects of each level, in order; None marks a level that is a single
+# module of topics rather than a package of subjects
+SECTIONS = {
+    'basic': ('mathematics', 'english', 'science', 'african studies'),
+    'secondary': ('mathematics', 'english', 'science', 'african studies', 'advanced research'),
+    'counselling': None,
+}
+
+@functools.lru_cache(maxsize=None)
+def load(level, subject=None):
+    """
+    Import and return the entries of one subject, e.g. load('basic', 'mathematics'),
+    or of a level without subjects, e.g. load('counselling'), as a read-only
+    view of the module's ENTRIES. Each subject is imported once, on first use.
+    """
+    name = f'.{level}' if subject is None else f'.{level}.{subject.replace(" ", "_")}'
+    return MappingProxyType(importlib.import_module(name, __name__).ENTRIES)
+
+class _LazySubjectDict(Mapping):
+    """
+    Subjects of one level, each loaded from its module on first access
+    """
+    def __init__(self, level):
+        self._level = level
+        self._subjects = SECTIONS[level]
+
+    def __getitem__(self, subject):
+        if subject not in self._subjects:
+            raise KeyError(subject)
+        return load(self._level, subject)
+
+    def __iter__(self):
+        return iter(self._subjects)
+
+    def __len__(self):
+        return len(self._subjects)
+
+    def __contains__(self, subject):
+        return subject in self._subjects
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+class _LazyLevelDict(Mapping):
+    """
+    OFFLINE_DATA: {level: {subject: {topic: (text, reference)}}}, loading
+    each subject (or subjectless level) on first access
+    """
+    def __init__(self):
+        self._levels = {level: _LazySubjectDict(level) if subjects else None
+                        for level, subjects in SECTIONS.items()}
+
+    def __getitem__(self, level):
+        section = self._levels[level]
+        return load(level) if section is None else section
+
+    def __iter__(self):
+        return iter(self._levels)
+
+    def __len__(self):
+        return len(self._levels)
+
+    def __contains__(self, level):
+        return level in self._levels
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+OFFLINE_DATA = _LazyLevelDict()
+
+# Build output: the packed text blob, a marshal dump of its index, REFERENCES
+# and compression dictionary, and the search database, each used while it
+# is newer than every source module. Kept next to the bytecode cache, which
+# is likewise regenerated from the sources and never committed
+BUILD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__')
+# marshal's format can change between Python versions, so the index file is
+# named after the interpreter's bytecode cache tag like a .pyc, and so is the
+# blob its offsets point into
+BLOB_PATH = os.path.join(BUILD_DIR, f'offline_data.{sys.implementation.cache_tag}.blob')
+INDEX_PATH = os.path.join(BUILD_DIR, f'offline_data.{sys.implementation.cache_tag}.marshal')
+DB_PATH = os.path.join(BUILD_DIR, 'offline_data.db')
+
+# Search database: one row per entry (subject is NULL for levels without
+# subjects) and an FTS5 index over the topics and text
+DB_SCHEMA = '''
+    CREATE TABLE entries (
+        id INTEGER PRIMARY KEY,
+        level TEXT NOT NULL,
+        subject TEXT,
+        topic TEXT NOT NULL,
+        body TEXT NOT NULL,
+        reference INTEGER NOT NULL
+    );
+    CREATE VIRTUAL TABLE entries_fts USING fts5(
+        topic, body, content='entries', content_rowid='id'
+    );
+'''
+
+# Size of the zstd dictionary trained on the entries; they share a lot of
+# phrasing, which per-entry compression can only exploit through a dictionary
+ZSTD_DICT_SIZE = 8 * 1024
+
+def _walk(section, path):
+    """Yield (path, text, reference) for every entry under section, in order"""
+    for key, value in section.items():
+        if isinstance(value, Mapping):
+            yield from _walk(value, path + (key,))
+        else:
+            yield (path + (key,),) + tuple(value)
+
+def pack(compress=False):
+    """
+    Pack the text of every entry into one UTF-8 blob.
+    Returns (index, blob, zstd_dict), where index maps each entry's key path,
+    e.g. ('basic', 'mathematics', 'addition'), to (offset, length, reference).
+    With compress=True (and zstandard installed) each entry is stored as its
+    own zstd frame using a dictionary trained on all entries, returned as
+    zstd_dict; otherwise zstd_dict is None. Entries with the same text share
+    one copy in the blob.
+    """
+    paths = []
+    texts = []
+    for path, text, reference in _walk(OFFLINE_DATA, ()):
+        paths.append((path, reference))
+        texts.append(text.encode('utf-8'))
+    
+    zstd_dict = None
+    if compress and zstandard is not None:
+        trained = zstandard.train_dictionary(ZSTD_DICT_SIZE, texts)
+        compressor = zstandard.ZstdCompressor(level=19, dict_data=trained, write_dict_id=False)
+        texts = [compressor.compress(text) for text in texts]
+        zstd_dict = trained.as_bytes()
+    
+    # Identical entries are stored once: the blob is addressed by content,
+    # and every entry with the same bytes points at the first copy
+    index = {}
+    offsets = {}
+    offset = 0
+    for (path, reference), data in zip(paths, texts):
+        if data not in offsets:
+            offsets[data] = offset
+            offset += len(data)
+        index[path] = (offsets[data], len(data), reference)
+    return index, b''.join(offsets), zstd_dict
+
+def fill_database(conn):
+    """
+    Create the search tables in the sqlite3 connection conn and insert every
+    entry. Raises sqlite3.OperationalError if sqlite was built without FTS5.
+    """
+    conn.executescript(DB_SCHEMA)
+    conn.executemany(
+        "INSERT INTO entries (level, subject, topic, body, reference) VALUES (?, ?, ?, ?, ?)",
+        ((path[0], path[1] if len(path) > 2 else None, path[-1], text, reference)
+         for path, text, reference in _walk(OFFLINE_DATA, ()))
+    )
+    conn.execute("INSERT INTO entries_fts (entries_fts) VALUES ('rebuild')")
+    conn.commit()
+
+def _replace(path, write):
+    """
+    Create path through write(tmp_path), writing a temporary file next to it
+    and renaming it over path. The old file is never truncated, so a process
+    that has it memory-mapped or open keeps reading the complete old data.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _write_file(data):
+    """write function for _replace() that saves the bytes data"""
+    def write(path):
+        with open(path, 'wb') as f:
+            f.write(data)
+    return write
+
+def build_pack(blob_path=BLOB_PATH, index_path=INDEX_PATH, compress=True):
+    """
+    Write the packed text to blob_path (memory-mapped at runtime), and its
+    index, REFERENCES and compression dictionary to index_path
+    """
+    index, blob, zstd_dict = pack(compress)
+    _replace(blob_path, _write_file(blob))
+    _replace(index_path, _write_file(marshal.dumps((index, REFERENCES, zstd_dict))))
+    return blob_path, index_path
+
+def build_database(db_path=DB_PATH):
+    """Write the search database to db_path"""
+    def write(path):
+        conn = sqlite3.connect(path)
+        try:
+            fill_database(conn)
+        finally:
+            conn.close()
+    _replace(db_path, write)
+    return db_path
+
+def build(blob_path=BLOB_PATH, index_path=INDEX_PATH, db_path=DB_PATH, compress=True):
+    """
+    Write the packed text, its index and the search database, replacing
+    any earlier build (see build_pack() and build_database())
+    """
+    return build_pack(blob_path, index_path, compress) + (build_database(db_path),)
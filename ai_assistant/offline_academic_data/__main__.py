@@ -0,0 +1,9 @@
+"""
+Build the packed offline academic data:
+
+    python -m ai_assistant.offline_academic_data
+"""
+from . import build
+
+for path in build():
+    print(f"Wrote {path}")
@@ -0,0 +1,12 @@
+"""
+Basic level subjects, one module each. Subject modules are also available
+as attributes, e.g. offline_academic_data.basic.mathematics, imported on first use
+"""
+import importlib
+
+def __getattr__(name):
+    try:
+        module = importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return module
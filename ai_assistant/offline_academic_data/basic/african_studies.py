@@ -0,0 +1,95 @@
+"""
+Basic level african studies entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "nile river": (
+        "The Nile River is the longest river in Africa, flowing through several countries including Egypt and Sudan. "
+        "It is vital for agriculture and transport. "
+        "Example: Ancient Egyptians depended on the Nile for farming.",
+        106,
+    ),
+    "sahara desert": (
+        "The Sahara is the largest hot desert in the world, located in North Africa. "
+        "It covers over 9 million square kilometers. "
+        "Example: Camels are used for transport in the Sahara.",
+        107,
+    ),
+    "ancient egypt": (
+        "Ancient Egypt was a civilization of ancient North Africa, concentrated along the lower reaches of the Nile River. "
+        "It is famous for pyramids, pharaohs, and hieroglyphics. "
+        "Example: The Great Pyramid of Giza.",
+        108,
+    ),
+    "folktales": (
+        "African folktales are traditional stories passed down through generations. "
+        "They teach morals and explain natural events. "
+        "Example: Anansi the Spider stories from West Africa.",
+        109,
+    ),
+    "baobab tree": (
+        "The baobab tree is known as the tree of life in Africa. "
+        "It stores water in its trunk and provides food and shelter. "
+        "Example: Baobab fruit is rich in vitamin C.",
+        110,
+    ),
+    "drum": (
+        "Drums are important musical instruments in African culture. "
+        "They are used in ceremonies, storytelling, and communication. "
+        "Example: Djembe drum from West Africa.",
+        111,
+    ),
+    "kente cloth": (
+        "Kente cloth is a colorful fabric from Ghana. "
+        "It is handwoven and worn during important events. "
+        "Example: Chiefs wear kente during festivals.",
+        112,
+    ),
+    "masai": (
+        "The Masai are a group of people living in Kenya and Tanzania. "
+        "They are known for their cattle herding and colorful dress. "
+        "Example: Masai jumping dance.",
+        113,
+    ),
+    "swahili": (
+        "Swahili is a widely spoken language in East Africa. "
+        "It is used in trade, education, and government. "
+        "Example: 'Jambo' means hello in Swahili.",
+        114,
+    ),
+    "zulu": (
+        "Zulu is a major ethnic group in South Africa. "
+        "They have a rich history and are known for their beadwork and dance. "
+        "Example: Zulu reed dance festival.",
+        115,
+    ),
+    "yoruba": (
+        "Yoruba is a large ethnic group in Nigeria. "
+        "They are known for their art, music, and religion. "
+        "Example: Yoruba talking drums.",
+        116,
+    ),
+    "igbo": (
+        "Igbo is one of the largest ethnic groups in Africa. "
+        "They are known for their festivals and entrepreneurship. "
+        "Example: New Yam Festival.",
+        117,
+    ),
+    "ashanti": (
+        "The Ashanti are a major ethnic group in Ghana. "
+        "They are famous for their gold, kente cloth, and traditional stools. "
+        "Example: The Golden Stool of Ashanti.",
+        118,
+    ),
+    "timbuktu": (
+        "Timbuktu is an ancient city in Mali, famous for its history and learning. "
+        "It was a center of trade and Islamic scholarship. "
+        "Example: Ancient manuscripts of Timbuktu.",
+        119,
+    ),
+    "mandela": (
+        "Nelson Mandela was a leader in the fight against apartheid in South Africa. "
+        "He became the first black president of South Africa in 1994. "
+        "Example: Mandela's release from prison in 1990.",
+        120,
+    )
+}
@@ -0,0 +1,160 @@
+"""
+Basic level english entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "noun": (
+        "A noun is a word that names a person, place, thing, or idea. For example, 'dog', 'city', and 'happiness' are nouns. "
+        "Nouns can be common (cat) or proper (London).",
+        25,
+    ),
+    "verb": (
+        "A verb is a word that expresses an action or a state of being. For example, 'run', 'think', and 'is' are verbs. "
+        "Verbs can show what someone does or what something is.",
+        26,
+    ),
+    "adjective": (
+        "An adjective is a word that describes a noun. For example, 'blue', 'quick', and 'happy' are adjectives. "
+        "Adjectives tell us more about nouns, like 'a tall building'.",
+        27,
+    ),
+    "sentence": (
+        "A sentence is a group of words that expresses a complete thought. For example, 'The sun is shining.' "
+        "A sentence starts with a capital letter and ends with a full stop, question mark, or exclamation mark.",
+        28,
+    ),
+    "alphabet": (
+        "The alphabet is a set of letters used in a language. The English alphabet has 26 letters from A to Z. "
+        "Learning the alphabet is the first step in reading and writing.",
+        29,
+    ),
+    "reading": (
+        "Reading is the process of looking at and understanding written words. For example, reading a book or a sign. "
+        "Reading helps us learn new things and enjoy stories.",
+        30,
+    ),
+    "writing": (
+        "Writing is the act of forming letters and words on a surface. For example, writing a letter or a story. "
+        "Writing helps us communicate ideas and information.",
+        31,
+    ),
+    "pronoun": (
+        "A pronoun is a word that takes the place of a noun. For example, 'he', 'she', 'it', and 'they' are pronouns. "
+        "Pronouns help avoid repeating the same nouns.",
+        32,
+    ),
+    "adverb": (
+        "An adverb modifies a verb, adjective, or another adverb. For example, 'quickly', 'very', and 'well' are adverbs. "
+        "Adverbs often tell us how, when, or where something happens.",
+        33,
+    ),
+    "preposition": (
+        "A preposition shows the relationship of a noun or pronoun to another word. For example, 'in', 'on', 'under', and 'with'. "
+        "Prepositions tell us about place, time, and direction.",
+        34,
+    ),
+    "conjunction": (
+        "A conjunction joins words or groups of words. For example, 'and', 'but', and 'or' are conjunctions. "
+        "Conjunctions help connect ideas in sentences.",
+        35,
+    ),
+    "interjection": (
+        "An interjection expresses strong feeling or emotion. For example, 'Wow!', 'Oh!', and 'Oops!'. "
+        "Interjections are often followed by an exclamation mark.",
+        36,
+    ),
+    "capital letter": (
+        "A capital letter is used at the beginning of a sentence or proper noun. For example, 'London' and 'Sarah'. "
+        "Capital letters show importance and start new sentences.",
+        37,
+    ),
+    "full stop": (
+        "A full stop is used at the end of a sentence. For example, 'The cat sleeps.' "
+        "It shows that a thought is complete.",
+        38,
+    ),
+    "question mark": (
+        "A question mark is used at the end of a question. For example, 'How are you?' "
+        "It shows that a sentence is asking something.",
+        39,
+    ),
+    "comma": (
+        "A comma is used to separate items in a list. For example, 'I bought apples, oranges, and bananas.' "
+        "Commas also separate parts of sentences.",
+        40,
+    ),
+    "exclamation mark": (
+        "An exclamation mark shows strong feeling. For example, 'Wow!' or 'Stop!' "
+        "It is used after interjections and exclamatory sentences.",
+        41,
+    ),
+    "vowel": (
+        "A vowel is a, e, i, o, or u. Every English word has at least one vowel. "
+        "Vowels are important for making syllables and words.",
+        42,
+    ),
+    "consonant": (
+        "A consonant is any letter that is not a vowel. For example, b, c, d, f, etc. "
+        "Consonants and vowels work together to form words.",
+        43,
+    ),
+    "syllable": (
+        "A syllable is a unit of pronunciation. For example, 'cat' has one syllable, 'happy' has two. "
+        "Syllables help us break words into parts for reading and spelling.",
+        44,
+    ),
+    "rhyming words": (
+        "Rhyming words sound the same at the end. For example, 'cat' and 'hat'. "
+        "Rhymes are used in poems and songs.",
+        45,
+    ),
+    "opposite words": (
+        "Opposite words have different meanings. For example, 'hot' and 'cold'. "
+        "Learning opposites helps expand vocabulary.",
+        46,
+    ),
+    "synonyms": (
+        "Synonyms are words with similar meanings. For example, 'happy' and 'joyful'. "
+        "Using synonyms makes writing more interesting.",
+        47,
+    ),
+    "antonyms": (
+        "Antonyms are words with opposite meanings. For example, 'up' and 'down'. "
+        "Antonyms help us describe differences.",
+        46,
+    ),
+    "plural": (
+        "Plural means more than one. For example, 'cats' is the plural of 'cat'. "
+        "Plurals are formed in different ways, like adding -s or -es.",
+        48,
+    ),
+    "singular": (
+        "Singular means one. For example, 'dog' is singular, 'dogs' is plural. "
+        "Singular and plural forms help us talk about quantity.",
+        48,
+    ),
+    "story": (
+        "A story is a description of imaginary or real events. For example, fairy tales and news reports are stories. "
+        "Stories have a beginning, middle, and end.",
+        49,
+    ),
+    "poem": (
+        "A poem is a piece of writing with rhythm and imagery. For example, 'Twinkle, Twinkle, Little Star' is a poem. "
+        "Poems can rhyme and use creative language.",
+        50,
+    ),
+    "letter writing": (
+        "Letter writing is a way to communicate in writing. For example, writing a thank-you note or an email. "
+        "Letters have a greeting, body, and closing.",
+        51,
+    ),
+    "greeting": (
+        "A greeting is a polite word or sign of welcome. For example, 'Hello', 'Good morning', and 'Hi'. "
+        "Greetings are used at the start of conversations and letters.",
+        52,
+    ),
+    "farewell": (
+        "A farewell is a word or act of saying goodbye. For example, 'Goodbye', 'See you later', and 'Take care'. "
+        "Farewells are used at the end of conversations and letters.",
+        53,
+    )
+}
@@ -0,0 +1,180 @@
+"""
+Basic level mathematics entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "addition": (
+        "Addition is the process of finding the total or sum by combining two or more numbers. "
+        "For example, 2 + 3 = 5. Addition is used in daily life when counting money or objects.",
+        0,
+    ),
+    "subtraction": (
+        "Subtraction is taking one number away from another. For example, 5 - 2 = 3. "
+        "Subtraction is used to find out how much is left after taking some away.",
+        0,
+    ),
+    "multiplication": (
+        "Multiplication is repeated addition of the same number. For example, 3 x 4 = 12 means 3 added 4 times. "
+        "It is used in calculating area, arrays, and groups.",
+        1,
+    ),
+    "division": (
+        "Division is splitting a number into equal parts. For example, 12 ÷ 3 = 4. "
+        "Division is used in sharing, grouping, and distributing items.",
+        1,
+    ),
+    "shapes": (
+        "Basic shapes include circle, square, triangle, and rectangle. Each shape has unique properties: a square has 4 equal sides, a triangle has 3 sides, etc. "
+        "Shapes are found everywhere, such as wheels (circles) and books (rectangles).",
+        2,
+    ),
+    "fractions": (
+        "A fraction represents a part of a whole, like 1/2 means one out of two equal parts. "
+        "Fractions are used in cooking, measuring, and dividing objects.",
+        3,
+    ),
+    "place value": (
+        "Place value is the value of each digit in a number, such as the 5 in 53 means 50. "
+        "Understanding place value helps in reading and writing large numbers.",
+        4,
+    ),
+    "counting": (
+        "Counting is listing numbers in order, usually starting from one. For example, 1, 2, 3, 4... "
+        "Counting is the basis for all math and is used in daily life.",
+        5,
+    ),
+    "even numbers": (
+        "Even numbers are divisible by 2, such as 2, 4, 6, 8. "
+        "Even numbers end in 0, 2, 4, 6, or 8.",
+        6,
+    ),
+    "odd numbers": (
+        "Odd numbers are not divisible by 2, such as 1, 3, 5, 7. "
+        "Odd numbers end in 1, 3, 5, 7, or 9.",
+        6,
+    ),
+    "number line": (
+        "A number line is a straight line with numbers placed at equal intervals. It helps in addition, subtraction, and understanding negative numbers. "
+        "For example, to add 2 + 3, start at 2 and move 3 steps right.",
+        7,
+    ),
+    "greater than": (
+        "Greater than means bigger in value. For example, 7 is greater than 5. The symbol is >. "
+        "Used in comparing numbers and quantities.",
+        8,
+    ),
+    "less than": (
+        "Less than means smaller in value. For example, 3 is less than 8. The symbol is <. "
+        "Used in comparing numbers and quantities.",
+        8,
+    ),
+    "equal to": (
+        "Equal to means the same in value. For example, 4 + 2 is equal to 6. The symbol is =. "
+        "Used in equations and comparisons.",
+        8,
+    ),
+    "tens and units": (
+        "Tens and units are place values in numbers. In 34, 3 is tens and 4 is units. "
+        "Understanding this helps in addition and subtraction.",
+        4,
+    ),
+    "hundreds": (
+        "Hundreds is the third place value in a number. In 245, 2 is hundreds. "
+        "Used in reading and writing large numbers.",
+        4,
+    ),
+    "skip counting": (
+        "Skip counting is counting forward or backward by a number other than 1. For example, 2, 4, 6, 8... "
+        "It helps in learning multiplication tables.",
+        9,
+    ),
+    "ordinal numbers": (
+        "Ordinal numbers show position or order, such as 1st, 2nd, 3rd. "
+        "Used in races, lists, and rankings.",
+        9,
+    ),
+    "money": (
+        "Money is used to buy goods and services. Coins and notes have different values. "
+        "Learning about money helps in shopping and saving.",
+        10,
+    ),
+    "time": (
+        "Time is measured in seconds, minutes, and hours. A clock shows time. "
+        "Understanding time helps in daily routines and schedules.",
+        11,
+    ),
+    "calendar": (
+        "A calendar shows days, weeks, and months in a year. For example, January is the first month. "
+        "Calendars help us plan events and remember important dates.",
+        12,
+    ),
+    "measurement": (
+        "Measurement is finding the length, size, or amount of something. We use rulers, scales, and cups to measure. "
+        "Measurement is important in cooking, building, and science.",
+        13,
+    ),
+    "weight": (
+        "Weight is how heavy something is. We use kilograms and grams to measure weight. "
+        "Knowing weight helps in shopping and cooking.",
+        13,
+    ),
+    "capacity": (
+        "Capacity is how much something can hold. We use liters and milliliters to measure capacity. "
+        "Used in cooking and science experiments.",
+        13,
+    ),
+    "temperature": (
+        "Temperature tells how hot or cold something is. We use degrees Celsius or Fahrenheit. "
+        "Thermometers are used to measure temperature.",
+        14,
+    ),
+    "patterns": (
+        "Patterns are repeated designs or sequences, such as red-blue-red-blue. "
+        "Patterns are found in art, music, and nature.",
+        15,
+    ),
+    "bar graph": (
+        "A bar graph is a chart that uses bars to show data. Each bar shows a value. "
+        "Bar graphs are used in surveys and science.",
+        16,
+    ),
+    "pictogram": (
+        "A pictogram uses pictures to show data. Each picture stands for a number of things. "
+        "Pictograms are used in books and signs.",
+        17,
+    ),
+    "tally marks": (
+        "Tally marks are used to count objects. Every fifth mark crosses the previous four. "
+        "Tally marks are used in counting votes and scores.",
+        18,
+    ),
+    "word problems": (
+        "Word problems use stories to describe math problems. For example, 'If you have 3 apples and get 2 more, how many do you have?' "
+        "Solving word problems helps in real-life situations.",
+        19,
+    ),
+    "basic probability": (
+        "Probability is the chance of something happening. For example, flipping a coin has a probability of 1/2 for heads. "
+        "Probability is used in games and predictions.",
+        20,
+    ),
+    "simple equations": (
+        "Simple equations use numbers and symbols to show equality, like x + 2 = 5. "
+        "Solving equations helps in finding unknown values.",
+        21,
+    ),
+    "rounding numbers": (
+        "Rounding means making a number simpler but keeping its value close. For example, 47 rounded to the nearest ten is 50. "
+        "Rounding is used in estimation and mental math.",
+        22,
+    ),
+    "estimation": (
+        "Estimation is finding a value close to the actual answer. For example, estimating the number of candies in a jar. "
+        "Estimation is useful when an exact answer is not needed.",
+        23,
+    ),
+    "division with remainder": (
+        "Division with remainder is when a number does not divide evenly. For example, 7 ÷ 2 = 3 remainder 1. "
+        "This is used in sharing and grouping objects.",
+        24,
+    )
+}
@@ -0,0 +1,317 @@
+"""
+Basic level science entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "plant": (
+        "A plant is a living thing that grows in the ground and usually has leaves, stems, and roots. "
+        "Plants make their own food through photosynthesis and provide oxygen. "
+        "Example: Mango tree, maize plant.",
+        54,
+    ),
+    "animal": (
+        "An animal is a living creature that moves and eats other things for energy. "
+        "Animals can be wild or domestic, and include mammals, birds, fish, and insects. "
+        "Example: Lion, goat, butterfly.",
+        55,
+    ),
+    "water cycle": (
+        "The water cycle is the journey water takes as it moves from the land to the sky and back again. "
+        "It includes evaporation, condensation, precipitation, and collection. "
+        "Example: Rain falls, water evaporates from lakes, forms clouds, and rains again.",
+        56,
+    ),
+    "human body": (
+        "The human body is made up of many parts that work together to keep us alive. "
+        "Major systems include the circulatory, respiratory, digestive, and nervous systems. "
+        "Example: The heart pumps blood, the lungs help us breathe.",
+        57,
+    ),
+    "senses": (
+        "The five senses are sight, hearing, taste, touch, and smell. "
+        "They help us understand and interact with the world. "
+        "Example: We use our eyes to see, ears to hear.",
+        58,
+    ),
+    "food chain": (
+        "A food chain shows how each living thing gets food. "
+        "It starts with plants, then herbivores, then carnivores. "
+        "Example: Grass → Grasshopper → Bird → Hawk.",
+        59,
+    ),
+    "habitat": (
+        "A habitat is the natural home of an animal or plant. "
+        "Habitats include forests, deserts, rivers, and grasslands. "
+        "Example: Fish live in water habitats, lions in savannas.",
+        60,
+    ),
+    "weather": (
+        "Weather is the condition of the atmosphere at a certain time. "
+        "It includes temperature, rain, wind, and sunshine. "
+        "Example: Sunny, rainy, windy, or cloudy days.",
+        61,
+    ),
+    "seasons": (
+        "Seasons are times of the year with different weather. "
+        "The four seasons are spring, summer, autumn, and winter. "
+        "Example: In Africa, rainy and dry seasons are common.",
+        62,
+    ),
+    "sun": (
+        "The sun is the star at the center of our solar system. "
+        "It provides light and heat for life on Earth. "
+        "Example: Plants need sunlight to grow.",
+        63,
+    ),
+    "moon": (
+        "The moon is Earth's only natural satellite. "
+        "It affects tides and can be seen in different phases. "
+        "Example: Full moon, new moon.",
+        64,
+    ),
+    "stars": (
+        "Stars are huge balls of burning gas in space. "
+        "They form constellations and can be seen at night. "
+        "Example: The North Star, Orion's Belt.",
+        65,
+    ),
+    "earth": (
+        "Earth is the planet we live on. "
+        "It has land, water, air, and supports life. "
+        "Example: Africa is one of Earth's continents.",
+        66,
+    ),
+    "air": (
+        "Air is the mixture of gases we breathe. "
+        "It contains oxygen, which is essential for life. "
+        "Example: We need air to breathe.",
+        67,
+    ),
+    "soil": (
+        "Soil is the upper layer of earth where plants grow. "
+        "It contains minerals, water, and organic matter. "
+        "Example: Farmers grow crops in soil.",
+        68,
+    ),
+    "rocks": (
+        "Rocks are solid mineral material forming part of the surface of the earth. "
+        "There are three types: igneous, sedimentary, and metamorphic. "
+        "Example: Granite, sandstone, marble.",
+        69,
+    ),
+    "energy": (
+        "Energy is what makes things move and work. "
+        "It comes in forms like heat, light, and motion. "
+        "Example: The sun gives us solar energy.",
+        70,
+    ),
+    "magnet": (
+        "A magnet is an object that attracts iron. "
+        "Magnets have north and south poles and are used in many devices. "
+        "Example: Fridge magnets, compasses.",
+        71,
+    ),
+    "light": (
+        "Light helps us see things. "
+        "It travels in straight lines and can be reflected or refracted. "
+        "Example: Mirrors reflect light, water bends light.",
+        72,
+    ),
+    "sound": (
+        "Sound is what we hear. "
+        "It is made by vibrations and travels through air, water, or solids. "
+        "Example: Drums make sound by vibrating.",
+        73,
+    ),
+    "force": (
+        "A force is a push or pull. "
+        "Forces can move objects or change their shape. "
+        "Example: Kicking a ball, opening a door.",
+        74,
+    ),
+    "gravity": (
+        "Gravity is the force that pulls things toward the earth. "
+        "It keeps us on the ground and makes things fall. "
+        "Example: An apple falling from a tree.",
+        75,
+    ),
+    "recycling": (
+        "Recycling is reusing materials to make new things. "
+        "It helps reduce waste and protect the environment. "
+        "Example: Recycling plastic bottles into new products.",
+        76,
+    ),
+    "pollution": (
+        "Pollution is making the environment dirty. "
+        "It can harm plants, animals, and people. "
+        "Example: Smoke from cars, plastic in rivers.",
+        77,
+    ),
+    "healthy living": (
+        "Healthy living means taking care of your body. "
+        "It includes eating well, exercising, and getting enough sleep. "
+        "Example: Eating fruits, playing sports.",
+        78,
+    ),
+    "disease": (
+        "A disease is an illness that affects the body. "
+        "Diseases can be caused by germs, poor nutrition, or genetics. "
+        "Example: Malaria, flu, diabetes.",
+        79,
+    ),
+    "medicine": (
+        "Medicine is used to treat diseases. "
+        "It can be in the form of pills, syrups, or injections. "
+        "Example: Paracetamol for fever.",
+        80,
+    ),
+    "safety": (
+        "Safety means being free from danger. "
+        "It involves following rules and using protective equipment. "
+        "Example: Wearing a helmet when riding a bicycle.",
+        81,
+    ),
+    "experiment": (
+        "An experiment is a test to learn something new. "
+        "It involves making observations and drawing conclusions. "
+        "Example: Mixing vinegar and baking soda to see bubbles.",
+        82,
+    ),
+    "photosynthesis": (
+        "Photosynthesis is the process by which green plants use sunlight to make food from carbon dioxide and water. "
+        "It produces oxygen and glucose. "
+        "Example: Leaves turning sunlight into energy.",
+        83,
+    ),
+    "germination": (
+        "Germination is the process by which a plant grows from a seed. "
+        "It needs water, warmth, and air. "
+        "Example: Beans sprouting in wet cotton.",
+        84,
+    ),
+    "evaporation": (
+        "Evaporation is the process of turning liquid into vapor. "
+        "It happens when water is heated. "
+        "Example: Puddles drying after rain.",
+        85,
+    ),
+    "condensation": (
+        "Condensation is the process by which vapor becomes liquid. "
+        "It forms clouds and dew. "
+        "Example: Water droplets on a cold glass.",
+        86,
+    ),
+    "precipitation": (
+        "Precipitation is any form of water that falls from clouds. "
+        "It includes rain, snow, sleet, and hail. "
+        "Example: Rain falling from the sky.",
+        87,
+    ),
+    "volcano": (
+        "A volcano is an opening in the earth's crust that allows molten rock to escape. "
+        "Volcanoes can erupt with lava, ash, and gases. "
+        "Example: Mount Kilimanjaro in Tanzania.",
+        88,
+    ),
+    "earthquake": (
+        "An earthquake is the shaking of the surface of the earth. "
+        "It is caused by movement of tectonic plates. "
+        "Example: Earthquakes in East Africa Rift Valley.",
+        89,
+    ),
+    "tsunami": (
+        "A tsunami is a large sea wave caused by an underwater earthquake. "
+        "Tsunamis can cause flooding and damage. "
+        "Example: 2004 Indian Ocean tsunami.",
+        90,
+    ),
+    "fossil": (
+        "A fossil is the remains or impression of a prehistoric organism. "
+        "Fossils help scientists learn about ancient life. "
+        "Example: Dinosaur bones, leaf imprints.",
+        91,
+    ),
+    "insect": (
+        "An insect is a small animal with six legs and usually wings. "
+        "Insects include ants, butterflies, and beetles. "
+        "Example: Honeybee, mosquito.",
+        92,
+    ),
+    "amphibian": (
+        "An amphibian is an animal that lives both in water and on land. "
+        "Amphibians include frogs, toads, and salamanders. "
+        "Example: African bullfrog.",
+        93,
+    ),
+    "reptile": (
+        "A reptile is a cold-blooded animal with scales. "
+        "Reptiles include snakes, lizards, and crocodiles. "
+        "Example: Nile crocodile.",
+        94,
+    ),
+    "mammal": (
+        "A mammal is a warm-blooded animal with hair or fur. "
+        "Mammals give birth to live young and feed them milk. "
+        "Example: Elephant, human, bat.",
+        95,
+    ),
+    "bird": (
+        "A bird is a warm-blooded animal with feathers and wings. "
+        "Birds lay eggs and most can fly. "
+        "Example: Ostrich, eagle, sparrow.",
+        96,
+    ),
+    "fish": (
+        "A fish is a cold-blooded animal that lives in water and has gills. "
+        "Fish lay eggs and have scales. "
+        "Example: Tilapia, catfish.",
+        97,
+    ),
+    "life cycle": (
+        "A life cycle is the series of changes in the life of an organism. "
+        "It includes birth, growth, reproduction, and death. "
+        "Example: Butterfly life cycle: egg, larva, pupa, adult.",
+        98,
+    ),
+    "adaptation": (
+        "Adaptation is a change by which an organism becomes better suited to its environment. "
+        "Adaptations can be physical or behavioral. "
+        "Example: Camels store fat in their humps for desert survival.",
+        99,
+    ),
+    "camouflage": (
+        "Camouflage is the coloring or patterns that help an animal blend in. "
+        "It helps animals hide from predators or sneak up on prey. "
+        "Example: Chameleons change color to match their surroundings.",
+        100,
+    ),
+    "predator": (
+        "A predator is an animal that hunts other animals for food. "
+        "Predators have adaptations like sharp teeth or claws. "
+        "Example: Lion, eagle.",
+        101,
+    ),
+    "prey": (
+        "Prey is an animal that is hunted by another animal. "
+        "Prey animals often have adaptations to escape predators. "
+        "Example: Rabbit, antelope.",
+        102,
+    ),
+    "herbivore": (
+        "A herbivore is an animal that eats only plants. "
+        "Herbivores have flat teeth for grinding leaves. "
+        "Example: Cow, giraffe.",
+        103,
+    ),
+    "carnivore": (
+        "A carnivore is an animal that eats only other animals. "
+        "Carnivores have sharp teeth for tearing meat. "
+        "Example: Lion, crocodile.",
+        104,
+    ),
+    "omnivore": (
+        "An omnivore is an animal that eats both plants and animals. "
+        "Omnivores can adapt to many environments. "
+        "Example: Human, baboon.",
+        105,
+    )
+}
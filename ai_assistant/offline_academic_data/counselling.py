@@ -0,0 +1,53 @@
+"""
+Academic counselling entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "academic counselling": (
+        "What is academic counselling? Academic counselling helps students make informed decisions about their studies, career paths, and personal development. "
+        "Who provides academic counselling? Academic counsellors, like Aivi, are trained to guide you on study skills, subject choices, and personal growth. "
+        "How does academic counselling help? Aivi can guide you on how to study effectively, choose subjects, manage time, set goals, and overcome challenges. "
+        "When should you seek academic counselling? You can ask for advice at any time, especially when you feel unsure, need motivation, or want to plan your future. "
+        "You can ask for advice on any topic in your curriculum, and Aivi will provide support, motivation, and resources tailored to your level and needs. "
+        "For example, you can say: 'Aivi, how do I improve in mathematics?' or 'Aivi, what should I do if I find science difficult?'",
+        208,
+    ),
+    "study tips": (
+        "Effective study habits include setting specific goals, creating a quiet study environment, taking regular breaks, and reviewing material frequently. "
+        "Use active learning techniques like summarizing, teaching others, and practicing with questions. "
+        "Stay organized with a planner and avoid last-minute cramming.",
+        209,
+    ),
+    "time management": (
+        "Good time management helps you balance school, home, and personal activities. "
+        "Prioritize tasks, use a calendar, break big tasks into smaller steps, and avoid procrastination. "
+        "Remember to schedule time for rest and hobbies.",
+        210,
+    ),
+    "subject choice": (
+        "Choosing the right subjects depends on your interests, strengths, and career goals. "
+        "Talk to teachers, research careers, and consider what subjects you enjoy and do well in. "
+        "Don't be afraid to ask for advice from family, friends, or your academic counsellor.",
+        211,
+    ),
+    "motivation": (
+        "Staying motivated can be hard, but setting clear goals, rewarding yourself for progress, and remembering your reasons for learning can help. "
+        "Surround yourself with positive influences and don't hesitate to ask for support when needed.",
+        212,
+    ),
+    "overcoming challenges": (
+        "Everyone faces challenges in their studies. Identify the problem, seek help early, and break tasks into manageable steps. "
+        "Use available resources like teachers, friends, and your academic counsellor. "
+        "Remember, persistence is key.",
+        213,
+    ),
+    "exam preparation": (
+        "Start preparing for exams early. Review notes regularly, practice with past questions, and get enough sleep before the exam. "
+        "Stay calm, plan your time, and read instructions carefully during the exam.",
+        214,
+    ),
+    "career guidance": (
+        "Career guidance helps you explore different professions, understand required skills, and plan your educational path. "
+        "Research careers, talk to professionals, and seek internships or volunteer opportunities to gain experience.",
+        215,
+    )
+}
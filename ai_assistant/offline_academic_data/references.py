@@ -0,0 +1,222 @@
+"""
+Further reading for each entry as (url, book), indexed by the reference
+number stored alongside the entry text
+"""
+REFERENCES = (
+    ("https://www.khanacademy.org/math/arithmetic/arith-review-add-subtract", "'Mathematics for Elementary School' by Pearson."),
+    ("https://www.khanacademy.org/math/arithmetic/arith-review-multiply-divide", "'Mathematics for Elementary School' by Pearson."),
+    ("https://www.mathsisfun.com/geometry/plane-shapes.html", "'Shapes and Geometry' by DK Publishing."),
+    ("https://www.khanacademy.org/math/arithmetic/fraction-arithmetic", "'Fractions, Decimals, and Percents' by David A. Adler."),
+    ("https://www.khanacademy.org/math/arithmetic/arith-review-place-value", "'Place Value' by David A. Adler."),
+    ("https://www.khanacademy.org/math/early-math/counting", "'Counting' by DK Publishing."),
+    ("https://www.mathsisfun.com/numbers/even-odd-numbers.html", "'Numbers' by DK Publishing."),
+    ("https://www.khanacademy.org/math/arithmetic/arith-review-negative-numbers/arith-review-number-line/v/number-line-intro", "'Number Lines' by DK Publishing."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-compare-order-topic", "'Comparing Numbers' by DK Publishing."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-counting-topic", "'Counting' by DK Publishing."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-money-topic", "'Money Math' by David A. Adler."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-time-topic", "'Telling Time' by Jules Older."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-time-topic", "'Calendars' by David A. Adler."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-measure-data-topic", "'Measuring Penny' by Loreen Leedy."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-measure-data-topic", "'What Is Temperature?' by Chris Arvetis."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-patterns-topic", "'Pattern Bugs' by Trudy Harris."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-measure-data-topic", "'The Great Graph Contest' by Loreen Leedy."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-measure-data-topic", "'Picture Graphs' by Molly Blaisdell."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-measure-data-topic", "'Tally O'Malley' by Stuart J. Murphy."),
+    ("https://www.khanacademy.org/math/early-math/cc-early-math-add-subtract-topic", "'Word Problems, Grade 1' by Spectrum."),
+    ("https://www.khanacademy.org/math/statistics-probability/probability-library", "'Probably Pistachio' by Stuart J. Murphy."),
+    ("https://www.khanacademy.org/math/algebra-basics/alg-basics-eq-ineq", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.khanacademy.org/math/arithmetic/arith-review-estimation-rounding", "'Rounding Numbers' by Rebecca Wingard-Nelson."),
+    ("https://www.khanacademy.org/math/arithmetic/arith-review-estimation-rounding", "'Estimation' by David A. Adler."),
+    ("https://www.khanacademy.org/math/arithmetic/arith-review-multiply-divide", "'Division' by Sheila Cato."),
+    ("https://www.grammarly.com/blog/nouns/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/verbs/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/adjective/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/sentence/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.englishclub.com/english-letters-alphabet.htm", "'Chicka Chicka Boom Boom' by Bill Martin Jr."),
+    ("https://www.readingrockets.org/", "'The Reading Strategies Book' by Jennifer Serravallo."),
+    ("https://www.readingrockets.org/teaching/writing", "'Writing Skills' by Diana Hanbury King."),
+    ("https://www.grammarly.com/blog/pronouns/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/adverbs/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/prepositions/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/conjunctions/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/interjections/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/capitalization-rules/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/period/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/question-mark/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/comma/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.grammarly.com/blog/exclamation-mark/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.englishclub.com/pronunciation/vowels.htm", "'Chicka Chicka Boom Boom' by Bill Martin Jr."),
+    ("https://www.englishclub.com/pronunciation/consonants.htm", "'Chicka Chicka Boom Boom' by Bill Martin Jr."),
+    ("https://www.readingrockets.org/strategies/syllable_games", "'Syllables' by Rebecca Felix."),
+    ("https://www.readingrockets.org/strategies/rhyming", "'Rhyming Dust Bunnies' by Jan Thomas."),
+    ("https://www.englishclub.com/vocabulary/opposites-antonyms.htm", "'Big and Small' by Britta Teckentrup."),
+    ("https://www.englishclub.com/vocabulary/synonyms.htm", "'The Synonym Finder' by J.I. Rodale."),
+    ("https://www.grammarly.com/blog/plural-nouns/", "'English Grammar in Use' by Raymond Murphy."),
+    ("https://www.readingrockets.org/strategies/story-maps", "'The True Story of the Three Little Pigs' by Jon Scieszka."),
+    ("https://www.poetryfoundation.org/", "'Where the Sidewalk Ends' by Shel Silverstein."),
+    ("https://www.readingrockets.org/strategies/letter-writing", "'The Jolly Postman' by Janet & Allan Ahlberg."),
+    ("https://www.englishclub.com/vocabulary/greetings.htm", "'Say Hello!' by Rachel Isadora."),
+    ("https://www.englishclub.com/vocabulary/greetings.htm", "'Goodbye Friend! Hello Friend!' by Cori Doerrfeld."),
+    ("https://www.britannica.com/science/plant", "'The Magic School Bus Plants Seeds' by Joanna Cole."),
+    ("https://www.nationalgeographic.com/animals", "'Animals: A Visual Encyclopedia' by DK Publishing."),
+    ("https://www.kidsdiscover.com/quick-reads/water-cycle/", "'The Drop in My Drink' by Meredith Hooper."),
+    ("https://kidshealth.org/en/kids/body.html", "'The Human Body Book' by Steve Parker."),
+    ("https://www.bbc.co.uk/bitesize/topics/z9yycdm", "'My Five Senses' by Aliki."),
+    ("https://www.nationalgeographic.org/encyclopedia/food-chain/", "'Who Eats What?' by Patricia Lauber."),
+    ("https://www.bbc.co.uk/bitesize/topics/zx882hv", "'About Habitats: Forests' by Cathryn Sill."),
+    ("https://www.weatherwizkids.com/", "'Weather' by Seymour Simon."),
+    ("https://www.metoffice.gov.uk/weather/learn-about/weather/seasons", "'The Reasons for Seasons' by Gail Gibbons."),
+    ("https://www.nasa.gov/audience/forstudents/k-4/stories/nasa-knows/what-is-the-sun-k4.html", "'The Sun Is My Favorite Star' by Frank Asch."),
+    ("https://www.nasa.gov/audience/forstudents/k-4/stories/nasa-knows/what-is-the-moon-k4.html", "'The Moon Book' by Gail Gibbons."),
+    ("https://www.space.com/56-stars-formation-and-evolution-of-stars.html", "'There Are Stars in the Sky' by Franklyn M. Branley."),
+    ("https://www.nasa.gov/audience/forstudents/k-4/stories/nasa-knows/what-is-earth-k4.html", "'Planet Earth/Inside Out' by Gail Gibbons."),
+    ("https://www.ducksters.com/science/earth_science/air.php", "'What Is the World Made Of?' by Kathleen Weidner Zoehfeld."),
+    ("https://www.soils4kids.org/", "'Dirt: The Scoop on Soil' by Natalie M. Rosinsky."),
+    ("https://www.bbc.co.uk/bitesize/topics/z9bbkqt", "'Rocks, Fossils, and Arrowheads' by Laura Evert."),
+    ("https://www.ducksters.com/science/energy.php", "'Energy Makes Things Happen' by Kimberly Brubaker Bradley."),
+    ("https://www.bbc.co.uk/bitesize/topics/zyttyrd", "'What Makes a Magnet?' by Franklyn M. Branley."),
+    ("https://www.bbc.co.uk/bitesize/topics/zbssgk7", "'Light: Shadows, Mirrors, and Rainbows' by Natalie M. Rosinsky."),
+    ("https://www.bbc.co.uk/bitesize/topics/zgffr82", "'All About Sound' by Lisa Trumbauer."),
+    ("https://www.bbc.co.uk/bitesize/topics/zvpp34j", "'Forces Make Things Move' by Kimberly Brubaker Bradley."),
+    ("https://spaceplace.nasa.gov/what-is-gravity/en/", "'Gravity Is a Mystery' by Franklyn M. Branley."),
+    ("https://www.epa.gov/recycle", "'Why Should I Recycle?' by Jen Green."),
+    ("https://www.nationalgeographic.com/environment/article/pollution", "'What a Waste' by Jess French."),
+    ("https://kidshealth.org/en/kids/healthy-eating/", "'Germs Are Not for Sharing' by Elizabeth Verdick."),
+    ("https://www.cdc.gov/diseasesconditions/", "'What Are Germs?' by Katie Daynes."),
+    ("https://kidshealth.org/en/kids/medicines.html", "'The Berenstain Bears Go to the Doctor' by Stan & Jan Berenstain."),
+    ("https://www.safekids.org/safetytips", "'Officer Buckle and Gloria' by Peggy Rathmann."),
+    ("https://www.sciencebuddies.org/science-fair-projects/science-projects", "'Ada Twist, Scientist' by Andrea Beaty."),
+    ("https://www.britannica.com/science/photosynthesis", "'Photosynthesis: Changing Sunlight into Food' by Bobbie Kalman."),
+    ("https://www.bbc.co.uk/bitesize/topics/zpxnyrd/articles/z2vdjxs", "'From Seed to Plant' by Gail Gibbons."),
+    ("https://www.weatherwizkids.com/weather-evaporation.htm", "'Water Up, Down, and All Around' by Natalie M. Rosinsky."),
+    ("https://www.weatherwizkids.com/weather-condensation.htm", "'Water Up, Down, and All Around' by Natalie M. Rosinsky."),
+    ("https://www.weatherwizkids.com/weather-precipitation.htm", "'Down Comes the Rain' by Franklyn M. Branley."),
+    ("https://www.britannica.com/science/volcano", "'Volcanoes' by Seymour Simon."),
+    ("https://www.usgs.gov/programs/earthquake-hazards/earthquakes", "'Earthquakes' by Seymour Simon."),
+    ("https://www.nationalgeographic.com/environment/natural-disasters/tsunami/", "'Tsunamis' by Cari Meister."),
+    ("https://www.britannica.com/science/fossil", "'Fossils Tell of Long Ago' by Aliki."),
+    ("https://www.britannica.com/animal/insect", "'The Big Book of Bugs' by Yuval Zommer."),
+    ("https://www.britannica.com/animal/amphibian", "'Frogs' by Gail Gibbons."),
+    ("https://www.britannica.com/animal/reptile", "'Snakes' by Gail Gibbons."),
+    ("https://www.britannica.com/animal/mammal", "'What Is a Mammal?' by Bobbie Kalman."),
+    ("https://www.britannica.com/animal/bird", "'Birds' by Kevin Henkes."),
+    ("https://www.britannica.com/animal/fish", "'Fish' by Jules Howard."),
+    ("https://www.bbc.co.uk/bitesize/topics/z6882hv/articles/zttckqt", "'The Very Hungry Caterpillar' by Eric Carle."),
+    ("https://www.bbc.co.uk/bitesize/topics/zvhhvcw/articles/zxg7y4j", "'What If You Had Animal Teeth?' by Sandra Markle."),
+    ("https://www.britannica.com/science/camouflage-biology", "'How to Hide a Lion' by Helen Stephens."),
+    ("https://www.bbc.co.uk/bitesize/topics/z6882hv/articles/z96vb9q", "'Predators' by Paul Harrison."),
+    ("https://www.bbc.co.uk/bitesize/topics/z6882hv/articles/z96vb9q", "'Prey' by Paul Harrison."),
+    ("https://www.britannica.com/animal/herbivore", "'What Do Animals Eat?' by Brenda Stones."),
+    ("https://www.britannica.com/animal/carnivore-mammal", "'What Do Animals Eat?' by Brenda Stones."),
+    ("https://www.britannica.com/animal/omnivore", "'What Do Animals Eat?' by Brenda Stones."),
+    ("https://www.britannica.com/place/Nile-River", "'The Nile River' by Allan Morey."),
+    ("https://www.britannica.com/place/Sahara-desert-Africa", "'The Sahara Desert' by Molly Aloian."),
+    ("https://www.history.com/topics/ancient-egypt/ancient-egypt", "'Ancient Egypt' by George Hart."),
+    ("https://www.panafricanalliance.com/african-folktales/", "'Nelson Mandela's Favorite African Folktales' by Nelson Mandela."),
+    ("https://www.britannica.com/plant/baobab-tree", "'The Baobab Tree' by Clifford B. Hicks."),
+    ("https://www.africa.upenn.edu/afrfocus/afrifocus021999.html", "'Drum Dream Girl' by Margarita Engle."),
+    ("https://www.britannica.com/topic/kente-cloth", "'Kente Colors' by Debbi Chocolate."),
+    ("https://www.britannica.com/topic/Masai", "'Masai and I' by Virginia Kroll."),
+    ("https://www.britannica.com/topic/Swahili-language", "'We All Went on Safari' by Laurie Krebs."),
+    ("https://www.britannica.com/topic/Zulu-people", "'Zulu Dog' by Anton Ferreira."),
+    ("https://www.britannica.com/topic/Yoruba", "'Yoruba Legends' by M.I. Ogumefu."),
+    ("https://www.britannica.com/topic/Igbo", "'Things Fall Apart' by Chinua Achebe."),
+    ("https://www.britannica.com/topic/Ashanti", "'Ashanti to Zulu: African Traditions' by Margaret Musgrove."),
+    ("https://www.britannica.com/place/Timbuktu", "'Timbuktu: The Sahara's Fabled City of Gold' by Marq de Villiers."),
+    ("https://www.nelsonmandela.org/", "'Long Walk to Freedom' by Nelson Mandela."),
+    ("https://www.khanacademy.org/math/algebra", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.khanacademy.org/math/geometry", "'Geometry: Seeing, Doing, Understanding' by Harold R. Jacobs."),
+    ("https://www.khanacademy.org/math/trigonometry", "'Trigonometry' by I.M. Gelfand."),
+    ("https://www.khanacademy.org/math/statistics-probability", "'The Cartoon Guide to Statistics' by Larry Gonick."),
+    ("https://www.khanacademy.org/math/statistics-probability/probability-library", "'Probability For Dummies' by Deborah Rumsey."),
+    ("https://www.khanacademy.org/math/algebra/quadratics", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.khanacademy.org/math/algebra/systems-of-equations", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.bbc.co.uk/bitesize/guides/z2dg87h/revision/1", "'Geometry: Seeing, Doing, Understanding' by Harold R. Jacobs."),
+    ("https://www.khanacademy.org/math/linear-algebra/vectors-and-spaces", "'Vector Calculus' by Jerrold E. Marsden."),
+    ("https://www.khanacademy.org/math/precalculus/precalc-matrices", "'Elementary Linear Algebra' by Howard Anton."),
+    ("https://www.khanacademy.org/math/algebra2/exponential-and-logarithmic-functions", "'Algebra and Trigonometry' by James Stewart."),
+    ("https://www.khanacademy.org/math/algebra/exponents", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.khanacademy.org/math/algebra2/variation", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.khanacademy.org/math/algebra/sequences", "'The Art of Problem Solving: Introduction to Counting & Probability' by David Patrick."),
+    ("https://www.khanacademy.org/math/algebra2/sequences-series", "'The Art of Problem Solving: Introduction to Counting & Probability' by David Patrick."),
+    ("https://www.khanacademy.org/math/geometry-home/coordinate-geometry", "'Geometry: Seeing, Doing, Understanding' by Harold R. Jacobs."),
+    ("https://www.khanacademy.org/math/geometry/hs-geo-transformations", "'Geometry: Seeing, Doing, Understanding' by Harold R. Jacobs."),
+    ("https://www.bbc.co.uk/bitesize/guides/z2dg87h/revision/2", "'Practical Navigation for the Modern Boat Owner' by Pat Manley."),
+    ("https://www.bbc.co.uk/bitesize/guides/z2dg87h/revision/3", "'Geometry: Seeing, Doing, Understanding' by Harold R. Jacobs."),
+    ("https://www.khanacademy.org/math/algebra/linear-inequalities", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.bbc.co.uk/bitesize/guides/z2dg87h/revision/4", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.khanacademy.org/math/algebra2/functions", "'Algebra and Trigonometry' by James Stewart."),
+    ("https://www.khanacademy.org/math/algebra/linear-equations", "'The Cartoon Guide to Statistics' by Larry Gonick."),
+    ("https://www.khanacademy.org/math/statistics-probability/probability-library", "'The Art of Problem Solving: Introduction to Counting & Probability' by David Patrick."),
+    ("https://www.khanacademy.org/math/algebra2/polynomial-functions/binomial-theorem", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.khanacademy.org/math/differential-calculus", "'Calculus' by James Stewart."),
+    ("https://www.khanacademy.org/math/integral-calculus", "'Calculus' by James Stewart."),
+    ("https://www.khanacademy.org/math/algebra2/complex-numbers", "'Algebra and Trigonometry' by James Stewart."),
+    ("https://www.khanacademy.org/math/algebra/polynomial-factorization", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.khanacademy.org/math/algebra2/rational-expressions-equations-functions", "'Algebra for Beginners' by Reza Nazari."),
+    ("https://www.skillsyouneed.com/write/summary.html", "'How to Write a Summary' by Liza Wiemer."),
+    ("https://www.readingrockets.org/strategies/comprehension", "'Reading Comprehension Success in 20 Minutes a Day' by LearningExpress."),
+    ("https://www.khanacademy.org/humanities/grammar/grammar-syntax/v/essay-writing", "'The Only Grammar Book You'll Ever Need' by Susan Thurman."),
+    ("https://www.britannica.com/art/literature", "'How to Read Literature Like a Professor' by Thomas C. Foster."),
+    ("https://www.britannica.com/art/drama-literature", "'The Norton Anthology of Drama.'"),
+    ("https://www.poetryfoundation.org/", "'The Poetry Handbook' by John Lennard."),
+    ("https://www.masterclass.com/articles/what-is-prose", "'Prose Style: A Contemporary Guide' by Robert Miles."),
+    ("https://www.skillsyouneed.com/ips/debate.html", "'The Debater's Guide' by Jon M. Ericson."),
+    ("https://www.skillsyouneed.com/write/report-writing.html", "'How to Write Reports and Proposals' by Patrick Forsyth."),
+    ("https://www.skillsyouneed.com/write/letters.html", "'How to Write Letters' by Crowther."),
+    ("https://www.skillsyouneed.com/write/speech.html", "'TED Talks: The Official TED Guide to Public Speaking' by Chris Anderson."),
+    ("https://www.skillsyouneed.com/write/articles.html", "'Writing Feature Articles' by Brendan Hennessy."),
+    ("https://www.masterclass.com/articles/what-is-narrative-writing", "'Narrative Writing' by George Hillocks Jr."),
+    ("https://www.masterclass.com/articles/how-to-write-dialogue", "'Writing Dialogue' by Tom Chiarella."),
+    ("https://www.masterclass.com/articles/characterization-definition", "'Characters & Viewpoint' by Orson Scott Card."),
+    ("https://literarydevices.net/theme/", "'How to Read Literature Like a Professor' by Thomas C. Foster."),
+    ("https://www.masterclass.com/articles/plot-of-a-story", "'Story: Substance, Structure, Style and the Principles of Screenwriting' by Robert McKee."),
+    ("https://www.masterclass.com/articles/setting-in-literature", "'The Art of Setting in Fiction' by Anne Dillard."),
+    ("https://literarydevices.net/conflict/", "'Story: Substance, Structure, Style and the Principles of Screenwriting' by Robert McKee."),
+    ("https://www.masterclass.com/articles/resolution-in-literature", "'Story: Substance, Structure, Style and the Principles of Screenwriting' by Robert McKee."),
+    ("https://www.masterclass.com/articles/point-of-view-in-writing", "'Characters & Viewpoint' by Orson Scott Card."),
+    ("https://literarydevices.net/tone/", "'The Elements of Style' by Strunk and White."),
+    ("https://literarydevices.net/mood/", "'The Elements of Style' by Strunk and White."),
+    ("https://literarydevices.net/figurative-language/", "'A Handbook to Literature' by William Harmon."),
+    ("https://literarydevices.net/simile/", "'A Handbook to Literature' by William Harmon."),
+    ("https://literarydevices.net/metaphor/", "'A Handbook to Literature' by William Harmon."),
+    ("https://literarydevices.net/personification/", "'A Handbook to Literature' by William Harmon."),
+    ("https://literarydevices.net/hyperbole/", "'A Handbook to Literature' by William Harmon."),
+    ("https://literarydevices.net/irony/", "'A Handbook to Literature' by William Harmon."),
+    ("https://www.khanacademy.org/science/organic-chemistry", "'Organic Chemistry' by Paula Yurkanis Bruice."),
+    ("https://www.khanacademy.org/science/physics/quantum-physics", "'Quantum Physics' by Alastair I.M. Rae."),
+    ("https://www.khanacademy.org/science/biology/central-dogma", "'Molecular Biology of the Cell' by Bruce Alberts."),
+    ("https://www.khanacademy.org/science/physics/thermodynamics", "'Thermodynamics: An Engineering Approach' by Yunus Çengel."),
+    ("https://www.khanacademy.org/science/biology/heredity", "'Genetics: A Conceptual Approach' by Benjamin Pierce."),
+    ("https://www.khanacademy.org/science/biology/chemistry--of-life", "'Lehninger Principles of Biochemistry' by David L. Nelson."),
+    ("https://www.khanacademy.org/science/biology/structure-of-a-cell", "'Molecular Biology of the Cell' by Bruce Alberts."),
+    ("https://www.khanacademy.org/science/biology/ecology", "'Ecology: Concepts and Applications' by Manuel Molles."),
+    ("https://www.khanacademy.org/science/biology/her/tree-of-life/a/evolution-and-natural-selection", "'The Greatest Show on Earth' by Richard Dawkins."),
+    ("https://www.khanacademy.org/science/physics/space", "'Astrophysics for People in a Hurry' by Neil deGrasse Tyson."),
+    ("https://au.int/en/overview", "'The African Union: Autocracy, Diplomacy and Peacebuilding in Africa' by Tony Karbo."),
+    ("https://www.britannica.com/topic/African-philosophy", "'African Philosophy: An Anthology' by Emmanuel Chukwudi Eze."),
+    ("https://www.britannica.com/topic/postcolonialism", "'The Post-Colonial Studies Reader' by Bill Ashcroft."),
+    ("https://www.britannica.com/art/African-literature", "'Things Fall Apart' by Chinua Achebe."),
+    ("https://en.wikipedia.org/wiki/African_feminism", "'African Women Writing Resistance' by Jennifer Browdy."),
+    ("https://www.britannica.com/topic/African-diaspora", "'The African Diaspora: A History Through Culture' by Patrick Manning."),
+    ("https://en.wikipedia.org/wiki/African_Renaissance", "'The African Renaissance: Roadmaps to the Challenge of Globalization' by Malegapuru William Makgoba."),
+    ("https://www.britannica.com/topic/Pan-Africanism", "'Pan-Africanism: A History' by Hakim Adi."),
+    ("https://www.coursera.org/learn/machine-learning", "'Hands-On Machine Learning with Scikit-Learn, Keras, and TensorFlow' by Aurélien Géron."),
+    ("https://www.nationalgeographic.com/environment/article/renewable-energy", "'Renewable Energy: Power for a Sustainable Future' by Godfrey Boyle."),
+    ("https://climate.nasa.gov/", "'This Changes Everything' by Naomi Klein."),
+    ("https://www.cdc.gov/publichealthgateway/", "'Introduction to Public Health' by Mary-Jane Schneider."),
+    ("https://www.entrepreneur.com/", "'The Lean Startup' by Eric Ries."),
+    ("https://www.ibm.com/cloud/learn/what-is-artificial-intelligence", "'Artificial Intelligence: A Guide for Thinking Humans' by Melanie Mitchell."),
+    ("https://www.coursera.org/specializations/data-science-python", "'Data Science for Business' by Foster Provost."),
+    ("https://www.ibm.com/topics/what-is-blockchain", "'Blockchain Basics' by Daniel Drescher."),
+    ("https://www.cisa.gov/", "'Cybersecurity for Beginners' by Raef Meeuwisse."),
+    ("https://sdgs.un.org/goals", "'Sustainable Development Goals Connectivity Dilemma' by Harri Paloheimo."),
+    ("https://www.unesco.org/en/education/guidance-counselling", "'Academic Advising: A Comprehensive Handbook' by Virginia N. Gordon."),
+    ("https://www.cornell.edu/academics/study-tips.cfm", "'Make It Stick: The Science of Successful Learning' by Peter C. Brown."),
+    ("https://www.skillsyouneed.com/ps/time-management.html", "'Time Management for Students' by Beverly A. Potter."),
+    ("https://www.prospects.ac.uk/careers-advice/what-can-i-do-with-my-degree", "'The Student's Guide to Choosing a Major' by Laurence Shatkin."),
+    ("https://www.mindtools.com/pages/article/motivation.htm", "'Drive: The Surprising Truth About What Motivates Us' by Daniel H. Pink."),
+    ("https://www.skillsyouneed.com/ps/problems-solving.html", "'Grit: The Power of Passion and Perseverance' by Angela Duckworth."),
+    ("https://www.topuniversities.com/student-info/health-and-support/exam-preparation-ten-study-tips", "'How to Pass Exams' by Dominic O'Brien."),
+    ("https://www.careers.govt.nz/", "'What Color Is Your Parachute?' by Richard N. Bolles."),
+)
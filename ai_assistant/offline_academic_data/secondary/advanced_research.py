@@ -0,0 +1,55 @@
+"""
+Secondary level advanced research entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "machine learning": (
+        "Machine learning is a field of artificial intelligence that uses statistical techniques to give computer systems the ability to learn from data. For example, teaching a computer to recognize faces in photos. "
+        "It is used in self-driving cars, healthcare, and finance.",
+        198,
+    ),
+    "renewable energy": (
+        "Renewable energy is energy from sources that are naturally replenishing such as solar, wind, and hydro. For example, using solar panels to generate electricity. "
+        "It helps reduce pollution and combat climate change.",
+        199,
+    ),
+    "climate change": (
+        "Climate change refers to long-term shifts in temperatures and weather patterns, mainly caused by human activities. For example, rising global temperatures. "
+        "It affects weather, agriculture, and sea levels.",
+        200,
+    ),
+    "public health": (
+        "Public health is the science of protecting and improving the health of people and their communities. For example, vaccination campaigns. "
+        "It focuses on disease prevention and health promotion.",
+        201,
+    ),
+    "entrepreneurship": (
+        "Entrepreneurship is the process of designing, launching, and running a new business. For example, starting a technology company. "
+        "Entrepreneurship drives innovation and economic growth.",
+        202,
+    ),
+    "artificial intelligence": (
+        "Artificial intelligence is the simulation of human intelligence in machines. For example, voice assistants like Siri and Alexa. "
+        "AI is used in robotics, healthcare, and customer service.",
+        203,
+    ),
+    "data science": (
+        "Data science is the study of data to extract meaningful insights. For example, analyzing sales data to predict trends. "
+        "It combines statistics, programming, and domain knowledge.",
+        204,
+    ),
+    "blockchain": (
+        "Blockchain is a system of recording information in a way that makes it difficult to change or hack. For example, cryptocurrencies like Bitcoin. "
+        "It is used in finance, supply chain, and voting systems.",
+        205,
+    ),
+    "cybersecurity": (
+        "Cybersecurity is the practice of protecting systems and networks from digital attacks. For example, using firewalls and encryption. "
+        "It is essential for privacy and data protection.",
+        206,
+    ),
+    "sustainable development": (
+        "Sustainable development is development that meets the needs of the present without compromising the future. For example, using renewable resources and reducing waste. "
+        "It balances economic, social, and environmental goals.",
+        207,
+    )
+}
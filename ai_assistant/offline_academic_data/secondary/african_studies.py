@@ -0,0 +1,45 @@
+"""
+Secondary level african studies entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "african union": (
+        "The African Union is a continental union consisting of 55 member states located on the continent of Africa. For example, it works to promote peace and development. "
+        "The AU addresses issues like health, security, and trade.",
+        190,
+    ),
+    "african philosophy": (
+        "African philosophy is the philosophical discourse produced by indigenous Africans and their descendants. For example, Ubuntu philosophy emphasizes community. "
+        "It explores African values, ethics, and worldviews.",
+        191,
+    ),
+    "post-colonial theory": (
+        "Post-colonial theory analyzes the cultural legacy of colonialism and imperialism. For example, examining African literature after independence. "
+        "It helps understand identity and resistance.",
+        192,
+    ),
+    "african literature": (
+        "African literature refers to the literary works of the African continent. For example, novels by Chinua Achebe. "
+        "It reflects African cultures, histories, and experiences.",
+        193,
+    ),
+    "african feminism": (
+        "African feminism is a form of feminism developed by African women. For example, advocating for women's rights in Africa. "
+        "It addresses gender equality and social justice.",
+        194,
+    ),
+    "african diaspora": (
+        "The African diaspora refers to communities descended from native Africans living outside Africa. For example, African Americans in the United States. "
+        "It explores migration, identity, and culture.",
+        195,
+    ),
+    "african renaissance": (
+        "The African Renaissance is a concept of renewed growth and development in Africa. For example, promoting education and innovation. "
+        "It encourages cultural pride and progress.",
+        196,
+    ),
+    "pan-african congress": (
+        "The Pan-African Congress was a series of meetings to address issues facing Africa due to European colonization. For example, the 1945 Congress in Manchester. "
+        "It played a key role in African independence movements.",
+        197,
+    )
+}
@@ -0,0 +1,150 @@
+"""
+Secondary level english entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "summary": (
+        "A summary is a brief statement of the main points of a text. For example, summarizing a story in a few sentences. "
+        "Summarizing helps you focus on key information.",
+        151,
+    ),
+    "comprehension": (
+        "Comprehension is understanding what you read. For example, after reading a passage, you answer questions about its main idea and details. "
+        "Comprehension skills are essential for academic success.",
+        152,
+    ),
+    "essay": (
+        "An essay is a short piece of writing on a particular subject. For example, writing an argumentative essay with an introduction, body, and conclusion. "
+        "Essay writing is important for exams and communication.",
+        153,
+    ),
+    "literature": (
+        "Literature refers to written works, especially those considered to have artistic merit. For example, novels, plays, and poems. "
+        "Studying literature improves language and critical thinking.",
+        154,
+    ),
+    "drama": (
+        "Drama is a mode of fictional representation through dialogue and performance. For example, Shakespeare's 'Romeo and Juliet.' "
+        "Drama helps develop empathy and understanding of human behavior.",
+        155,
+    ),
+    "poetry": (
+        "Poetry is a form of literature that uses aesthetic and rhythmic qualities of language. For example, haikus and sonnets. "
+        "Poetry enhances creativity and emotional expression.",
+        156,
+    ),
+    "prose": (
+        "Prose is written or spoken language in its ordinary form. For example, novels and essays. "
+        "Prose is used in most forms of communication.",
+        157,
+    ),
+    "debate": (
+        "A debate is a formal discussion on a particular topic. For example, a school debate on whether uniforms should be mandatory. "
+        "Debate develops critical thinking and public speaking skills.",
+        158,
+    ),
+    "report writing": (
+        "Report writing is presenting information clearly and concisely. For example, writing a science report on an experiment. "
+        "Report writing is important in academics and business.",
+        159,
+    ),
+    "letter writing": (
+        "Letter writing is a way to communicate in writing. For example, writing a formal letter to a principal. "
+        "Letter writing is used in personal and professional life.",
+        160,
+    ),
+    "speech": (
+        "A speech is a formal address or discourse. For example, writing a speech for a school event. "
+        "Speech writing is important for leadership and public speaking.",
+        161,
+    ),
+    "article": (
+        "An article is a piece of writing included with others in a newspaper or magazine. For example, a news article about a local event. "
+        "Articles inform, persuade, or entertain readers.",
+        162,
+    ),
+    "narrative": (
+        "A narrative is a spoken or written account of connected events. For example, telling a story about your childhood. "
+        "Narratives are used in literature and everyday communication.",
+        163,
+    ),
+    "dialogue": (
+        "Dialogue is a conversation between two or more people. For example, a conversation in a play. "
+        "Dialogue makes stories more realistic and engaging.",
+        164,
+    ),
+    "characterization": (
+        "Characterization is the creation of characters in a story. For example, describing a character's appearance and actions. "
+        "Characterization makes stories more vivid and believable.",
+        165,
+    ),
+    "theme": (
+        "Theme is the central topic of a text. For example, the theme of friendship in a novel. "
+        "Themes give deeper meaning to stories.",
+        166,
+    ),
+    "plot": (
+        "Plot is the sequence of events in a story. For example, the events leading to the resolution of a conflict. "
+        "Plot structure helps organize stories.",
+        167,
+    ),
+    "setting": (
+        "Setting is the time and place of a story. For example, a story set in Lagos, Nigeria. "
+        "Setting provides context for the action.",
+        168,
+    ),
+    "conflict": (
+        "Conflict is a struggle between opposing forces. For example, a character facing a difficult decision. "
+        "Conflict drives the plot of a story.",
+        169,
+    ),
+    "resolution": (
+        "Resolution is the solution to a problem in a story. For example, the hero saves the day. "
+        "Resolution brings closure to stories.",
+        170,
+    ),
+    "point of view": (
+        "Point of view is the perspective from which a story is told. For example, first-person or third-person narration. "
+        "Point of view affects how readers experience a story.",
+        171,
+    ),
+    "tone": (
+        "Tone is the author's attitude toward the subject. For example, a humorous or serious tone. "
+        "Tone influences how readers feel about a story.",
+        172,
+    ),
+    "mood": (
+        "Mood is the feeling created in the reader. For example, a suspenseful or joyful mood. "
+        "Mood helps set the atmosphere of a story.",
+        173,
+    ),
+    "figurative language": (
+        "Figurative language uses figures of speech to be more effective. For example, metaphors and similes. "
+        "Figurative language makes writing more vivid.",
+        174,
+    ),
+    "simile": (
+        "A simile compares two things using 'like' or 'as'. For example, 'as brave as a lion.' "
+        "Similes make descriptions more interesting.",
+        175,
+    ),
+    "metaphor": (
+        "A metaphor compares two things without using 'like' or 'as'. For example, 'Time is a thief.' "
+        "Metaphors create strong images in writing.",
+        176,
+    ),
+    "personification": (
+        "Personification gives human qualities to non-human things. For example, 'The wind whispered through the trees.' "
+        "Personification makes writing more lively.",
+        177,
+    ),
+    "hyperbole": (
+        "Hyperbole is exaggerated statements not meant to be taken literally. For example, 'I've told you a million times.' "
+        "Hyperbole adds emphasis to writing.",
+        178,
+    ),
+    "irony": (
+        "Irony is the use of words to convey a meaning opposite to their literal meaning. For example, saying 'What a pleasant day' during a storm. "
+        "Irony adds humor or emphasis.",
+        179,
+    )
+}
@@ -0,0 +1,160 @@
+"""
+Secondary level mathematics entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "algebra": (
+        "Algebra is a branch of mathematics dealing with symbols and the rules for manipulating those symbols. For example, solving x + 2 = 5 gives x = 3. "
+        "Algebra is used in problem-solving, science, and engineering.",
+        121,
+    ),
+    "geometry": (
+        "Geometry is the study of shapes, sizes, and properties of space. For example, calculating the area of a triangle or the circumference of a circle. "
+        "Geometry is used in architecture, art, and navigation.",
+        122,
+    ),
+    "trigonometry": (
+        "Trigonometry deals with the relationships between the angles and sides of triangles. For example, using sine, cosine, and tangent to find unknown sides. "
+        "Trigonometry is used in engineering, astronomy, and physics.",
+        123,
+    ),
+    "statistics": (
+        "Statistics is the study of collecting, analyzing, presenting, and interpreting data. For example, calculating the average score in a class. "
+        "Statistics is used in research, business, and government.",
+        124,
+    ),
+    "probability": (
+        "Probability measures the chance that an event will occur. For example, the probability of flipping a head on a coin is 1/2. "
+        "Probability is used in games, insurance, and risk assessment.",
+        125,
+    ),
+    "quadratic equation": (
+        "A quadratic equation is an equation of the form ax^2 + bx + c = 0. For example, x^2 - 5x + 6 = 0. "
+        "Quadratic equations are solved using factoring, completing the square, or the quadratic formula.",
+        126,
+    ),
+    "simultaneous equations": (
+        "Simultaneous equations are two or more equations solved together. For example, solving x + y = 5 and x - y = 1 gives x = 3, y = 2. "
+        "They are used in business, science, and engineering.",
+        127,
+    ),
+    "circle theorems": (
+        "Circle theorems are rules for angles, lengths, and areas in circles. For example, the angle at the center is twice the angle at the circumference. "
+        "Used in geometry and design.",
+        128,
+    ),
+    "vectors": (
+        "Vectors have both magnitude and direction. For example, a force of 5N to the east. "
+        "Vectors are used in physics, engineering, and navigation.",
+        129,
+    ),
+    "matrices": (
+        "Matrices are rectangular arrays of numbers. For example, [[1, 2], [3, 4]]. "
+        "Matrices are used in computer graphics, cryptography, and solving equations.",
+        130,
+    ),
+    "logarithms": (
+        "Logarithms are the inverse operation to exponentiation. For example, log10(100) = 2 because 10^2 = 100. "
+        "Logarithms are used in science, engineering, and finance.",
+        131,
+    ),
+    "indices": (
+        "Indices (exponents) show how many times a number is multiplied by itself. For example, 2^3 = 2 x 2 x 2 = 8. "
+        "Used in scientific notation and growth calculations.",
+        132,
+    ),
+    "variation": (
+        "Variation describes how one quantity changes with another. For example, direct variation: y = kx. "
+        "Used in science and economics.",
+        133,
+    ),
+    "sequence": (
+        "A sequence is an ordered list of numbers, such as 2, 4, 6, 8. "
+        "Sequences are used in patterns and coding.",
+        134,
+    ),
+    "series": (
+        "A series is the sum of the terms of a sequence. For example, 2 + 4 + 6 + 8. "
+        "Series are used in finance and science.",
+        135,
+    ),
+    "coordinate geometry": (
+        "Coordinate geometry uses algebra to study geometric problems. For example, finding the distance between two points (x1, y1) and (x2, y2). "
+        "Used in mapping and navigation.",
+        136,
+    ),
+    "transformation": (
+        "Transformation changes the position or size of a shape. For example, rotation, reflection, translation, and enlargement. "
+        "Used in art, design, and robotics.",
+        137,
+    ),
+    "bearing": (
+        "Bearing is the direction or path along which something moves, measured in degrees from north. For example, a bearing of 090° is due east. "
+        "Used in navigation and geography.",
+        138,
+    ),
+    "locus": (
+        "A locus is a set of points satisfying certain conditions. For example, all points equidistant from a center form a circle. "
+        "Used in geometry and engineering.",
+        139,
+    ),
+    "inequalities": (
+        "Inequalities show the relationship between two expressions that are not equal. For example, x > 3. "
+        "Used in economics and science.",
+        140,
+    ),
+    "surds": (
+        "Surds are irrational roots that cannot be simplified to remove the root. For example, √2. "
+        "Used in advanced mathematics and engineering.",
+        141,
+    ),
+    "functions": (
+        "A function is a relation between a set of inputs and a set of possible outputs. For example, f(x) = x^2. "
+        "Functions are used in programming, science, and engineering.",
+        142,
+    ),
+    "graphing": (
+        "Graphing is drawing a diagram to represent data or equations. For example, plotting y = 2x + 1 on a graph. "
+        "Used in science, business, and statistics.",
+        143,
+    ),
+    "permutations": (
+        "Permutations are arrangements of objects in a specific order. For example, the number of ways to arrange 3 books is 3! = 6. "
+        "Used in probability and computer science.",
+        144,
+    ),
+    "combinations": (
+        "Combinations are selections of items without regard to order. For example, choosing 2 fruits from apple, banana, and orange. "
+        "Used in probability and statistics.",
+        144,
+    ),
+    "binomial theorem": (
+        "The binomial theorem describes the algebraic expansion of powers of a binomial. For example, (a + b)^2 = a^2 + 2ab + b^2. "
+        "Used in algebra and probability.",
+        145,
+    ),
+    "differentiation": (
+        "Differentiation is finding the derivative of a function. For example, the derivative of x^2 is 2x. "
+        "Used in physics, engineering, and economics.",
+        146,
+    ),
+    "integration": (
+        "Integration is finding the area under a curve. For example, the integral of x is (1/2)x^2. "
+        "Used in physics, engineering, and statistics.",
+        147,
+    ),
+    "complex numbers": (
+        "Complex numbers have a real and an imaginary part. For example, 3 + 4i. "
+        "Used in engineering, physics, and mathematics.",
+        148,
+    ),
+    "polynomials": (
+        "Polynomials are expressions with more than one term. For example, x^2 + 3x + 2. "
+        "Used in algebra, calculus, and science.",
+        149,
+    ),
+    "rational expressions": (
+        "Rational expressions are ratios of polynomials. For example, (x+1)/(x-1). "
+        "Used in algebra and calculus.",
+        150,
+    )
+}
@@ -0,0 +1,55 @@
+"""
+Secondary level science entries: {topic: (text, reference)}
+"""
+ENTRIES = {
+    "organic chemistry": (
+        "Organic chemistry is the study of the structure, properties, and reactions of organic compounds and materials. For example, studying how alcohols and acids react. "
+        "It is important in medicine, biology, and industry.",
+        180,
+    ),
+    "quantum mechanics": (
+        "Quantum mechanics is a fundamental theory in physics describing the properties of nature on an atomic scale. For example, explaining how electrons move in atoms. "
+        "It is used in electronics, chemistry, and computing.",
+        181,
+    ),
+    "molecular biology": (
+        "Molecular biology is the branch of biology that deals with the structure and function of the macromolecules essential to life. For example, DNA and proteins. "
+        "It is key to genetics and biotechnology.",
+        182,
+    ),
+    "thermodynamics": (
+        "Thermodynamics is the branch of physics that deals with heat and temperature and their relation to energy and work. For example, how engines convert fuel to motion. "
+        "It is used in engineering, chemistry, and meteorology.",
+        183,
+    ),
+    "genetics": (
+        "Genetics is the study of genes, genetic variation, and heredity in living organisms. For example, how traits are inherited from parents. "
+        "It is important in medicine, agriculture, and research.",
+        184,
+    ),
+    "biochemistry": (
+        "Biochemistry is the study of chemical processes within living organisms. For example, how enzymes help digest food. "
+        "It connects biology and chemistry.",
+        185,
+    ),
+    "cell biology": (
+        "Cell biology is the study of cell structure and function. For example, how cells divide and communicate. "
+        "It is fundamental to all life sciences.",
+        186,
+    ),
+    "ecology": (
+        "Ecology is the study of interactions among organisms and their environment. For example, food webs in a forest. "
+        "It helps us understand environmental issues.",
+        187,
+    ),
+    "evolutionary biology": (
+        "Evolutionary biology is the study of the evolutionary processes that produced the diversity of life. For example, natural selection. "
+        "It explains how species change over time.",
+        188,
+    ),
+    "astrophysics": (
+        "Astrophysics is the branch of astronomy concerned with the physical nature of stars and other celestial bodies. For example, studying black holes and galaxies. "
+        "It helps us understand the universe.",
+        189,
+    )
+}
@@ -7,10 +7,12 @@ with context awareness and memory
 import re
 import random
 import json
+import itertools
 import os
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from . import offline_academic
-from . import tts
 
 # Try to import Ollama integration
 try:
@@ -20,7 +22,110 @@ except ImportError:
     ollama_integration = None
     OLLAMA_AVAILABLE = False
 
+# orjson writes saved sessions much faster than json when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Keywords of each intent, in priority order: the first intent with a
+# keyword anywhere in the (lowercased) input wins. Built once here rather
+# than on every _analyze_intent() call, as (intent, keywords) pairs
+_INTENTS = (
+    ('greeting', ('hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening')),
+    ('question', ('what', 'how', 'when', 'where', 'why', 'who', 'which', 'can you explain')),
+    ('help_request', ('help', 'assist', 'support', 'guide', 'show me', 'teach me')),
+    ('academic_query', ('explain', 'define', 'meaning of', 'tell me about', 'what is', 'how does')),
+    ('math_problem', ('solve', 'calculate', 'formula', 'equation', 'math', 'mathematics')),
+    ('study_help', ('study', 'learn', 'practice', 'quiz', 'test', 'exam', 'homework')),
+    ('personal', ('I am', 'my name is', 'I like', 'I prefer', 'I need', 'I want')),
+    ('gratitude', ('thank', 'thanks', 'appreciate', 'grateful')),
+    ('goodbye', ('bye', 'goodbye', 'see you', 'farewell', 'exit', 'quit')),
+    ('emotional', ('frustrated', 'confused', 'worried', 'happy', 'excited', 'sad', 'angry')),
+    ('clarification', ('repeat', 'again', 'clarify', 'explain again', 'I don\'t understand')),
+    ('encouragement_needed', ('difficult', 'hard', 'struggling', 'can\'t understand', 'give up')),
+)
+
+# Canned responses of each handler, cycled through in a shuffled order
+_GREETINGS = (
+    "Hello! I'm AIVI, your AI assistant. How can I help you today?",
+    "Hi there! I'm here to help with your studies and questions. What would you like to know?",
+    "Good to see you! I'm ready to assist with academics, accessibility, or any questions you have.",
+    "Hello! Welcome to AIVI. I can help with studies, answer questions, and assist with accessibility needs.",
+)
+
+_HELP_RESPONSES = (
+    "I'm here to help! I can assist with academic questions, accessibility features, study planning, and more. What specific area do you need help with?",
+    "Of course! I can help with studying, answering questions, reading text, converting to Braille, solving math problems, and many other tasks. What would you like to do?",
+    "I'd be happy to help! I have access to academic information in math, science, English, and history. I can also help with accessibility needs. What interests you?",
+    "Absolutely! I'm designed to help with education and accessibility. I can explain concepts, help with homework, read text aloud, and much more. How can I assist you today?",
+)
+
+_STUDY_TIPS = (
+    "Great that you're focusing on studying! I can help you with specific subjects, create study schedules, or quiz you on topics. What subject are you working on?",
+    "I'm here to support your studies! I can explain concepts, help with homework, or create practice questions. What would be most helpful right now?",
+    "Study time is important! I can assist with understanding difficult concepts, organizing your study schedule, or providing explanations. What's your current focus?",
+    "Excellent! Learning is a journey. I can help break down complex topics, provide examples, or quiz you. What subject or topic are you studying?",
+)
+
+_STUDY_ENCOURAGEMENTS = (
+    " You're doing great by seeking help!",
+    " Keep up the excellent work!",
+    " I believe in your ability to learn this!",
+    " Every question you ask helps you learn more!",
+)
+
+_GRATITUDE_RESPONSES = (
+    "You're very welcome! I'm happy to help anytime.",
+    "My pleasure! Feel free to ask if you have more questions.",
+    "Glad I could help! Is there anything else you'd like to know?",
+    "You're welcome! I'm here whenever you need assistance.",
+    "Happy to help! Don't hesitate to ask if you need anything else.",
+)
+
+_GOODBYES = (
+    "Goodbye! Feel free to come back anytime you need help with studies or have questions.",
+    "See you later! Remember, I'm always here to help with your learning journey.",
+    "Take care! Come back anytime you need academic assistance or have questions.",
+    "Farewell! Good luck with your studies, and don't hesitate to return if you need help.",
+)
+
+_ENCOURAGEMENTS = (
+    "Don't give up! Learning takes time and practice. Every challenge you overcome makes you stronger. What specific part can we work on together?",
+    "I believe in you! Sometimes concepts take time to click. Let's break this down into smaller, manageable pieces. What's the first thing you'd like to understand?",
+    "You're not alone in finding this difficult - it means you're challenging yourself! That's how real learning happens. How can I help make this clearer?",
+    "Remember, every expert was once confused too. Your persistence is admirable! Let's tackle this step by step. What would help most right now?",
+)
+
+_GENERAL_RESPONSES = (
+    "I'm not sure I fully understand. Could you rephrase your question or be more specific about what you'd like to know?",
+    "That's an interesting question! Could you provide more details so I can help you better?",
+    "I want to make sure I give you the best answer. Could you tell me more about what you're looking for?",
+    "I'm here to help! Could you clarify what specific information or assistance you need?",
+)
+
+def _shuffled_cycle(responses):
+    """Endless iterator over responses, in an order shuffled once"""
+    return itertools.cycle(random.sample(responses, len(responses)))
+
+class HistoryEntry:
+    """One turn of a conversation: the user's input and AIVI's response"""
+    __slots__ = ('elapsed_ns', 'user', 'context', 'ai_response')
+
+    def __init__(self, elapsed_ns, user, context=None, ai_response=''):
+        self.elapsed_ns = elapsed_ns  # perf_counter_ns() since session start
+        self.user = user
+        self.context = context
+        self.ai_response = ai_response
+
 class OfflineConversationAI:
+    __slots__ = (
+        'conversation_history', 'user_context', 'personality_traits', 'ollama_ready',
+        '_session_start_ns', '_greetings', '_help_responses', '_study_tips',
+        '_study_encouragements', '_gratitude_responses', '_goodbyes',
+        '_encouragements', '_general_responses'
+    )
+
     def __init__(self):
         self.conversation_history = []
         self.user_context = {
@@ -31,6 +136,18 @@ class OfflineConversationAI:
             'questions_asked': 0,
             'topics_discussed': []
         }
+        # History entries are stamped with perf_counter_ns() offsets from
+        # session_start, and turned into datetimes only when saved
+        self._session_start_ns = time.perf_counter_ns()
+        # Each handler's responses, in this session's order
+        self._greetings = _shuffled_cycle(_GREETINGS)
+        self._help_responses = _shuffled_cycle(_HELP_RESPONSES)
+        self._study_tips = _shuffled_cycle(_STUDY_TIPS)
+        self._study_encouragements = _shuffled_cycle(_STUDY_ENCOURAGEMENTS)
+        self._gratitude_responses = _shuffled_cycle(_GRATITUDE_RESPONSES)
+        self._goodbyes = _shuffled_cycle(_GOODBYES)
+        self._encouragements = _shuffled_cycle(_ENCOURAGEMENTS)
+        self._general_responses = _shuffled_cycle(_GENERAL_RESPONSES)
         self.personality_traits = {
             'helpful': 0.9,
             'encouraging': 0.8,
@@ -39,19 +156,24 @@ class OfflineConversationAI:
             'empathetic': 0.8
         }
 
-        # Check Ollama availability at initialization
+        # Check Ollama availability in the background, so that creating the
+        # instance (and importing this module) does not wait on the probe
         self.ollama_ready = False
         if OLLAMA_AVAILABLE:
-            try:
-                status = ollama_integration.get_ollama_status()
-                self.ollama_ready = status.get("ready_for_offline", False)
-                if self.ollama_ready:
-                    print("[Conversation AI] Ollama available for enhanced responses")
-                else:
-                    print("[Conversation AI] Ollama not ready, using fallback responses")
-            except Exception as e:
-                print(f"[Conversation AI] Error checking Ollama: {e}")
-                self.ollama_ready = False
+            threading.Thread(target=self._probe_ollama, daemon=True).start()
+
+    def _probe_ollama(self):
+        """Set ollama_ready from the Ollama status"""
+        try:
+            status = ollama_integration.get_ollama_status()
+            self.ollama_ready = status.get("ready_for_offline", False)
+            if self.ollama_ready:
+                print("[Conversation AI] Ollama available for enhanced responses")
+            else:
+                print("[Conversation AI] Ollama not ready, using fallback responses")
+        except Exception as e:
+            print(f"[Conversation AI] Error checking Ollama: {e}")
+            self.ollama_ready = False
         
     def process_conversation(self, user_input, context=None):
         """
@@ -62,18 +184,16 @@ class OfflineConversationAI:
             return "I'm here to help. What would you like to know or discuss?"
         
         # Add to conversation history
-        self.conversation_history.append({
-            'timestamp': datetime.now(),
-            'user': user_input,
-            'context': context
-        })
+        self.conversation_history.append(HistoryEntry(
+            time.perf_counter_ns() - self._session_start_ns, user_input, context
+        ))
         
         # Analyze user input
         intent = self._analyze_intent(user_input)
         response = self._generate_response(user_input, intent, context)
         
         # Add response to history
-        self.conversation_history[-1]['ai_response'] = response
+        self.conversation_history[-1].ai_response = response
         
         # Update user context
         self._update_context(user_input, intent)
@@ -86,28 +206,13 @@ class OfflineConversationAI:
         """
         input_lower = user_input.lower()
         
-        intents = {
-            'greeting': ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening'],
-            'question': ['what', 'how', 'when', 'where', 'why', 'who', 'which', 'can you explain'],
-            'help_request': ['help', 'assist', 'support', 'guide', 'show me', 'teach me'],
-            'academic_query': ['explain', 'define', 'meaning of', 'tell me about', 'what is', 'how does'],
-            'math_problem': ['solve', 'calculate', 'formula', 'equation', 'math', 'mathematics'],
-            'study_help': ['study', 'learn', 'practice', 'quiz', 'test', 'exam', 'homework'],
-            'personal': ['I am', 'my name is', 'I like', 'I prefer', 'I need', 'I want'],
-            'gratitude': ['thank', 'thanks', 'appreciate', 'grateful'],
-            'goodbye': ['bye', 'goodbye', 'see you', 'farewell', 'exit', 'quit'],
-            'emotional': ['frustrated', 'confused', 'worried', 'happy', 'excited', 'sad', 'angry'],
-            'clarification': ['repeat', 'again', 'clarify', 'explain again', 'I don\'t understand'],
-            'encouragement_needed': ['difficult', 'hard', 'struggling', 'can\'t understand', 'give up']
-        }
-        
-        detected_intents = []
-        for intent, keywords in intents.items():
+        # Intents are checked in priority order, so the first one with a
+        # matching keyword is the primary intent; the rest need not be checked
+        for intent, keywords in _INTENTS:
             if any(keyword in input_lower for keyword in keywords):
-                detected_intents.append(intent)
+                return intent
         
-        # Return primary intent (first detected) or 'general' if none found
-        return detected_intents[0] if detected_intents else 'general'
+        return 'general'
     
     def _generate_response(self, user_input, intent, context=None):
         """
@@ -141,14 +246,7 @@ class OfflineConversationAI:
     
     def _handle_greeting(self, user_input):
         """Handle greeting messages"""
-        greetings = [
-            "Hello! I'm AIVI, your AI assistant. How can I help you today?",
-            "Hi there! I'm here to help with your studies and questions. What would you like to know?",
-            "Good to see you! I'm ready to assist with academics, accessibility, or any questions you have.",
-            "Hello! Welcome to AIVI. I can help with studies, answer questions, and assist with accessibility needs."
-        ]
-        
-        greeting = random.choice(greetings)
+        greeting = next(self._greetings)
         
         # Personalize if we know the user's name
         if self.user_context['name']:
@@ -194,14 +292,7 @@ class OfflineConversationAI:
     
     def _handle_help_request(self, user_input):
         """Handle general help requests"""
-        help_responses = [
-            "I'm here to help! I can assist with academic questions, accessibility features, study planning, and more. What specific area do you need help with?",
-            "Of course! I can help with studying, answering questions, reading text, converting to Braille, solving math problems, and many other tasks. What would you like to do?",
-            "I'd be happy to help! I have access to academic information in math, science, English, and history. I can also help with accessibility needs. What interests you?",
-            "Absolutely! I'm designed to help with education and accessibility. I can explain concepts, help with homework, read text aloud, and much more. How can I assist you today?"
-        ]
-        
-        return random.choice(help_responses)
+        return next(self._help_responses)
     
     def _handle_math_problem(self, user_input):
         """Handle math-related queries"""
@@ -222,24 +313,11 @@ class OfflineConversationAI:
     
     def _handle_study_help(self, user_input):
         """Handle study-related requests"""
-        study_tips = [
-            "Great that you're focusing on studying! I can help you with specific subjects, create study schedules, or quiz you on topics. What subject are you working on?",
-            "I'm here to support your studies! I can explain concepts, help with homework, or create practice questions. What would be most helpful right now?",
-            "Study time is important! I can assist with understanding difficult concepts, organizing your study schedule, or providing explanations. What's your current focus?",
-            "Excellent! Learning is a journey. I can help break down complex topics, provide examples, or quiz you. What subject or topic are you studying?"
-        ]
-        
-        response = random.choice(study_tips)
+        response = next(self._study_tips)
         
         # Add encouragement based on personality
         if self.personality_traits['encouraging'] > 0.7:
-            encouragements = [
-                " You're doing great by seeking help!",
-                " Keep up the excellent work!",
-                " I believe in your ability to learn this!",
-                " Every question you ask helps you learn more!"
-            ]
-            response += random.choice(encouragements)
+            response += next(self._study_encouragements)
         
         return response
     
@@ -267,25 +345,11 @@ class OfflineConversationAI:
     
     def _handle_gratitude(self):
         """Handle thank you messages"""
-        gratitude_responses = [
-            "You're very welcome! I'm happy to help anytime.",
-            "My pleasure! Feel free to ask if you have more questions.",
-            "Glad I could help! Is there anything else you'd like to know?",
-            "You're welcome! I'm here whenever you need assistance.",
-            "Happy to help! Don't hesitate to ask if you need anything else."
-        ]
-        return random.choice(gratitude_responses)
+        return next(self._gratitude_responses)
     
     def _handle_goodbye(self):
         """Handle goodbye messages"""
-        goodbyes = [
-            "Goodbye! Feel free to come back anytime you need help with studies or have questions.",
-            "See you later! Remember, I'm always here to help with your learning journey.",
-            "Take care! Come back anytime you need academic assistance or have questions.",
-            "Farewell! Good luck with your studies, and don't hesitate to return if you need help."
-        ]
-        
-        goodbye = random.choice(goodbyes)
+        goodbye = next(self._goodbyes)
         
         if self.user_context['name']:
             goodbye = goodbye.replace("Goodbye!", f"Goodbye, {self.user_context['name']}!")
@@ -311,20 +375,14 @@ class OfflineConversationAI:
     def _handle_clarification_request(self):
         """Handle requests for clarification"""
         if self.conversation_history:
-            last_response = self.conversation_history[-1].get('ai_response', '')
+            last_response = self.conversation_history[-1].ai_response
             return f"Let me explain that differently: {last_response}\n\nIs there a specific part you'd like me to clarify further?"
         
         return "I'd be happy to clarify! What specifically would you like me to explain in more detail?"
     
     def _handle_encouragement(self):
         """Provide encouragement when user is struggling"""
-        encouragements = [
-            "Don't give up! Learning takes time and practice. Every challenge you overcome makes you stronger. What specific part can we work on together?",
-            "I believe in you! Sometimes concepts take time to click. Let's break this down into smaller, manageable pieces. What's the first thing you'd like to understand?",
-            "You're not alone in finding this difficult - it means you're challenging yourself! That's how real learning happens. How can I help make this clearer?",
-            "Remember, every expert was once confused too. Your persistence is admirable! Let's tackle this step by step. What would help most right now?"
-        ]
-        return random.choice(encouragements)
+        return next(self._encouragements)
     
     def _handle_general_query(self, user_input):
         """Handle general queries that don't fit specific categories"""
@@ -335,14 +393,7 @@ class OfflineConversationAI:
             return f"I found this information: {academic_response}\n\nWould you like me to explain anything further?"
         
         # Provide general helpful response
-        general_responses = [
-            "I'm not sure I fully understand. Could you rephrase your question or be more specific about what you'd like to know?",
-            "That's an interesting question! Could you provide more details so I can help you better?",
-            "I want to make sure I give you the best answer. Could you tell me more about what you're looking for?",
-            "I'm here to help! Could you clarify what specific information or assistance you need?"
-        ]
-        
-        return random.choice(general_responses)
+        return next(self._general_responses)
     
     def _update_context(self, user_input, intent):
         """Update user context based on conversation"""
@@ -375,6 +426,10 @@ class OfflineConversationAI:
         
         return summary
     
+    def _entry_time(self, item):
+        """Wall-clock time of a history entry"""
+        return self.user_context['session_start'] + timedelta(microseconds=item.elapsed_ns // 1000)
+
     def save_conversation_history(self, filename=None):
         """Save conversation history to file"""
         if not filename:
@@ -384,10 +439,10 @@ class OfflineConversationAI:
         data = {
             'conversation_history': [
                 {
-                    'timestamp': item['timestamp'].isoformat(),
-                    'user': item['user'],
-                    'ai_response': item.get('ai_response', ''),
-                    'context': item.get('context', {})
+                    'timestamp': self._entry_time(item).isoformat(),
+                    'user': item.user,
+                    'ai_response': item.ai_response,
+                    'context': item.context
                 }
                 for item in self.conversation_history
             ],
@@ -399,8 +454,20 @@ class OfflineConversationAI:
         }
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            encoded = None
+            if orjson is not None:
+                try:
+                    # Non-str keys in a caller's context are turned into
+                    # strings, as json.dump does
+                    encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                except TypeError:
+                    pass  # Something orjson cannot encode (e.g. a huge int); json may
+            if encoded is not None:
+                with open(filename, 'wb') as f:
+                    f.write(encoded)
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             return f"Conversation saved to {filename}"
         except Exception as e:
             return f"Failed to save conversation: {str(e)}"
@@ -14,6 +14,19 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 import hashlib
 import pickle
+import base64
+
+# Optional compression for cached search payloads
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Base64 of the zstd frame magic (0x28 B5 2F FD); marks compressed cache entries
+ZSTD_CACHE_PREFIX = "KLUv/"
+
+# Columns of the search cache CSV
+SEARCH_CACHE_FIELDS = ['query_hash', 'query', 'response', 'source', 'timestamp', 'access_count', 'etag']
 
 class OfflineDataManager:
     def __init__(self, data_dir: str = "offline_data"):
@@ -66,7 +79,25 @@ class OfflineDataManager:
         if not os.path.exists(self.search_cache_file):
             with open(self.search_cache_file, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                writer.writerow(['query_hash', 'query', 'response', 'source', 'timestamp', 'access_count'])
+                writer.writerow(SEARCH_CACHE_FIELDS)
+        else:
+            self._upgrade_search_cache_file()
+
+    def _upgrade_search_cache_file(self):
+        """Add columns introduced after the search cache file was created"""
+        try:
+            with open(self.search_cache_file, 'r', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                if reader.fieldnames == SEARCH_CACHE_FIELDS:
+                    return
+                rows = list(reader)
+            
+            with open(self.search_cache_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=SEARCH_CACHE_FIELDS, restval='', extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(rows)
+        except Exception as e:
+            self.logger.error(f"Error upgrading search cache file: {e}")
 
     def _initialize_database(self):
         """Initialize SQLite database for advanced queries"""
@@ -253,8 +284,12 @@ class OfflineDataManager:
                 self.logger.error(f"Error recording user interaction: {e}")
                 return False
 
-    def cache_online_search(self, query: str, response: str, source: str = "online"):
-        """Cache online search results for offline use"""
+    def cache_online_search(self, query: str, response: str, source: str = "online",
+                            etag: str = None):
+        """
+        Cache online search results for offline use
+        When etag is given, an existing entry's response and ETag are refreshed too
+        """
         with self._lock:
             try:
                 query_hash = hashlib.md5(query.encode()).hexdigest()
@@ -269,6 +304,9 @@ class OfflineDataManager:
                         if row['query_hash'] == query_hash:
                             row['access_count'] = str(int(row['access_count']) + 1)
                             row['timestamp'] = datetime.now().isoformat()
+                            if etag is not None:
+                                row['response'] = self._compress_response(response)
+                                row['etag'] = etag
                             cached = True
                         updated_rows.append(row)
                 
@@ -276,11 +314,11 @@ class OfflineDataManager:
                     # Add new cache entry
                     with open(self.search_cache_file, 'a', newline='', encoding='utf-8') as f:
                         writer = csv.writer(f)
-                        writer.writerow([query_hash, query, response, source, datetime.now().isoformat(), 1])
+                        writer.writerow([query_hash, query, self._compress_response(response), source, datetime.now().isoformat(), 1, etag or ''])
                 else:
                     # Update existing entry
                     with open(self.search_cache_file, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=['query_hash', 'query', 'response', 'source', 'timestamp', 'access_count'])
+                        writer = csv.DictWriter(f, fieldnames=SEARCH_CACHE_FIELDS)
                         writer.writeheader()
                         writer.writerows(updated_rows)
                 
@@ -332,10 +370,11 @@ class OfflineDataManager:
                         self._update_cache_access(query_hash)
                         return {
                             'query': row['query'],
-                            'response': row['response'],
+                            'response': self._decompress_response(row['response']),
                             'source': row['source'],
                             'timestamp': row['timestamp'],
-                            'access_count': int(row['access_count'])
+                            'access_count': int(row['access_count']),
+                            'etag': row.get('etag') or None
                         }
             
             return None
@@ -344,6 +383,34 @@ class OfflineDataManager:
             self.logger.error(f"Error retrieving search cache: {e}")
             return None
 
+    def _compress_response(self, response: str) -> str:
+        """Compress a cached response with zstd, stored as base64 text in the CSV"""
+        if zstandard is None:
+            return response
+        try:
+            # A compressor per call: zstd contexts must not be shared between
+            # the GUI and voice threads
+            compressor = zstandard.ZstdCompressor(level=3)
+            packed = base64.b64encode(compressor.compress(response.encode('utf-8'))).decode('ascii')
+            # Short responses don't compress well; keep them readable
+            return packed if len(packed) < len(response) else response
+        except Exception as e:
+            self.logger.error(f"Error compressing cache entry: {e}")
+            return response
+
+    def _decompress_response(self, stored: str) -> str:
+        """Decompress a cached response, passing legacy plain-text entries through"""
+        if not stored.startswith(ZSTD_CACHE_PREFIX):
+            return stored
+        if zstandard is None:
+            self.logger.warning("Cached entry is zstd-compressed but zstandard is not installed")
+            return stored
+        try:
+            return zstandard.ZstdDecompressor().decompress(base64.b64decode(stored)).decode('utf-8')
+        except Exception as e:
+            self.logger.error(f"Error decompressing cache entry: {e}")
+            return stored
+
     def _update_cache_access(self, query_hash: str):
         """Update cache access count"""
         try:
@@ -357,7 +424,7 @@ class OfflineDataManager:
                     updated_rows.append(row)
             
             with open(self.search_cache_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['query_hash', 'query', 'response', 'source', 'timestamp', 'access_count'])
+                writer = csv.DictWriter(f, fieldnames=SEARCH_CACHE_FIELDS)
                 writer.writeheader()
                 writer.writerows(updated_rows)
                 
@@ -450,7 +517,7 @@ class OfflineDataManager:
                         updated_rows.append(row)
             
             with open(self.search_cache_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['query_hash', 'query', 'response', 'source', 'timestamp', 'access_count'])
+                writer = csv.DictWriter(f, fieldnames=SEARCH_CACHE_FIELDS)
                 writer.writeheader()
                 writer.writerows(updated_rows)
             
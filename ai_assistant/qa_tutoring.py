@@ -2,7 +2,9 @@
 Interactive Q&A and Tutoring module
 """
 import random
-from .offline_academic import offline_search, offline_data, get_mode
+from collections.abc import Mapping
+from . import offline_academic
+from .offline_academic import offline_search, get_mode
 
 def answer_question(question):
     """
@@ -59,13 +61,13 @@ def quiz_mode(level=None, subject=None, num_questions=5):
     
     # Gather all possible questions as (level, subject, topic, content)
     questions = []
-    for lvl, subjects in offline_data.items():
+    for lvl, subjects in offline_academic.offline_data.items():
         if level and lvl != level:
             continue
         for subj, topics in subjects.items():
             if subject and subj != subject:
                 continue
-            if isinstance(topics, dict):
+            if isinstance(topics, Mapping):
                 for topic, content in topics.items():
                     questions.append((lvl, subj, topic, content))
     if not questions:
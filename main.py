@@ -37,6 +37,14 @@ def request_admin_privileges():
 
 from splash_launcher import StandaloneSplashScreen
 
+# Load environment variables (API keys) from .env file (optional)
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    # dotenv not available, environment variables won't be loaded from .env file
+    pass
+
 # Import AI assistant modules (with optional dependencies)
 import ai_assistant.tts as tts
 import ai_assistant.offline_academic as offline_academic
@@ -222,6 +230,10 @@ class ModernAIVIGUI:
                 
         except Exception as e:
             print(f"⚠ Error initializing enhanced components: {e}")
+        
+        # Load the offline academic data in the background so the first
+        # academic question doesn't wait for it
+        threading.Thread(target=offline_academic.prewarm, daemon=True).start()
     
     def show_splash_screen(self):
         """Show the splash screen and then initialize GUI"""
@@ -1875,7 +1887,9 @@ class ModernAIVIGUI:
                             response += f"• Topics covered: {stats.get('topics_count', 0)}\n"
                             response += f"• Data sources: {stats.get('sources_count', 0)}\n"
                             response += f"• Last updated: {stats.get('last_updated', 'Unknown')}\n"
-                            response += f"• Search cache entries: {stats.get('cache_entries', 0)}"
+                            response += f"• Search cache entries: {stats.get('cache_entries', 0)}\n"
+                            entry_cache = offline_academic.cache_stats()['get_entry']
+                            response += f"• Academic lookups cached: {entry_cache.hits} hits, {entry_cache.misses} misses"
                         else:
                             response = "Knowledge base is not available. Enhanced offline features are not loaded."
                     
@@ -6,10 +6,15 @@ Verify OpenAI integration with offline caching works correctly
 
 import sys
 import os
+import csv
+import hashlib
+import tempfile
+import threading
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from ai_assistant import offline_manager
 from ai_assistant.offline_manager import OfflineDataManager
 
 def test_offline_manager():
@@ -132,6 +137,84 @@ def test_knowledge_base_structure():
     print()
     return True
 
+def test_search_cache_compression():
+    """Test compressed and legacy plain-text search cache entries"""
+    print("=" * 60)
+    print("Testing Search Cache Compression")
+    print("=" * 60)
+    print()
+    
+    with tempfile.TemporaryDirectory() as data_dir:
+        manager = OfflineDataManager(data_dir)
+        response = "Photosynthesis converts light energy into chemical energy. " * 20
+        
+        print("1. Round-tripping a long response...")
+        assert manager.cache_online_search("photosynthesis", response, source="wikipedia")
+        with open(manager.search_cache_file, 'r', encoding='utf-8') as f:
+            stored = next(row for row in csv.DictReader(f) if row['query'] == "photosynthesis")
+        if offline_manager.zstandard is not None:
+            assert stored['response'].startswith(offline_manager.ZSTD_CACHE_PREFIX)
+        assert manager.get_search_cache("photosynthesis")['response'] == response
+        print("   ✓ Response restored\n")
+        
+        print("2. Reading a legacy plain-text entry...")
+        with open(manager.search_cache_file, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerow([hashlib.md5(b"gravity").hexdigest(), 'gravity',
+                                    'Gravity attracts masses.', 'online',
+                                    '2024-01-01T00:00:00', '1', ''])
+        assert manager.get_search_cache("gravity")['response'] == 'Gravity attracts masses.'
+        print("   ✓ Plain text passed through\n")
+        
+        print("3. Compressing from several threads at once...")
+        errors = []
+        def round_trip(n):
+            text = f"Entry {n}: " + "cells divide by mitosis " * 50
+            if manager._decompress_response(manager._compress_response(text)) != text:
+                errors.append(n)
+        threads = [threading.Thread(target=round_trip, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        print("   ✓ All round trips intact\n")
+    
+    return True
+
+def test_search_cache_upgrade():
+    """Test that a search cache written before the etag column is upgraded"""
+    print("=" * 60)
+    print("Testing Search Cache Upgrade")
+    print("=" * 60)
+    print()
+    
+    with tempfile.TemporaryDirectory() as data_dir:
+        cache_file = os.path.join(data_dir, "search_cache.csv")
+        with open(cache_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['query_hash', 'query', 'response', 'source', 'timestamp', 'access_count'])
+            writer.writerow([hashlib.md5(b"gravity").hexdigest(), 'gravity',
+                             'Gravity attracts masses.', 'online', '2024-01-01T00:00:00', '3'])
+        
+        print("1. Loading a legacy 6-column search_cache.csv...")
+        manager = OfflineDataManager(data_dir)
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        assert reader.fieldnames == offline_manager.SEARCH_CACHE_FIELDS
+        assert len(rows) == 1 and rows[0]['etag'] == '' and rows[0]['access_count'] == '3'
+        print("   ✓ Header upgraded and rows kept\n")
+        
+        print("2. Reading and updating the upgraded entry...")
+        cached = manager.get_search_cache("gravity")
+        assert cached['response'] == 'Gravity attracts masses.' and cached['etag'] is None
+        assert manager.cache_online_search("gravity", "Gravity pulls masses together.", etag='"v2"')
+        cached = manager.get_search_cache("gravity")
+        assert cached['response'] == 'Gravity pulls masses together.' and cached['etag'] == '"v2"'
+        print("   ✓ ETag stored on refresh\n")
+    
+    return True
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -142,6 +225,8 @@ def main():
     tests = [
         ("Knowledge Base Structure", test_knowledge_base_structure),
         ("Offline Manager Functionality", test_offline_manager),
+        ("Search Cache Compression", test_search_cache_compression),
+        ("Search Cache Upgrade", test_search_cache_upgrade),
     ]
     
     passed = 0
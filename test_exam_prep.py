@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test Exam Prep
+Verify simulated answers and that old quiz results are archived and still reported
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_assistant import exam_prep
+
+def _write_result(progress_dir, name, days_ago, percentage):
+    """Write a saved quiz result started days_ago days back"""
+    started = datetime.now() - timedelta(days=days_ago)
+    path = os.path.join(progress_dir, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'quiz_id': name, 'started_at': started.isoformat(), 'percentage': percentage}, f)
+    os.utime(path, (started.timestamp(), started.timestamp()))
+
+def test_progress_rotation():
+    """Test that archived results still count in long progress reports"""
+    print("=" * 60)
+    print("Testing progress file rotation")
+    print("=" * 60)
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            system = exam_prep.ExamPrepSystem()
+            _write_result(system.progress_dir, 'results_old1.json', 120, 40.0)
+            _write_result(system.progress_dir, 'results_old2.json', 150, 60.0)
+            _write_result(system.progress_dir, 'results_new.json', 5, 80.0)
+
+            assert system._rotate_progress_files() == 2
+            names = sorted(os.listdir(system.progress_dir))
+            assert 'results_new.json' in names
+            assert not any(name.startswith('results_old') for name in names)
+            assert any(name.startswith('progress_') for name in names)
+            print("   ✓ Results older than 90 days archived by month")
+
+            assert system._rotate_progress_files() == 0
+            assert system.get_progress_report(days=30)['total_quizzes'] == 1
+            report = system.get_progress_report(days=180)
+            assert report['total_quizzes'] == 3
+            assert report['average_score'] == 60.0
+            assert system.get_progress_report(days=130)['total_quizzes'] == 2
+            print("   ✓ Archived results included in long reports\n")
+        finally:
+            os.chdir(original_cwd)
+
+    return True
+
+def test_simulate_answers_bulk():
+    """Test that simulated answers come from each question's options"""
+    print("=" * 60)
+    print("Testing _simulate_answers_bulk()")
+    print("=" * 60)
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            system = exam_prep.ExamPrepSystem()
+            quizzes = [system.generate_quiz("Science", "Plants", num_questions=n) for n in (3, 5)]
+            quizzes.append(system.generate_quiz("History", "Ghana", 2, question_type='true_false'))
+            quizzes[0]['questions'][1] = dict(quizzes[0]['questions'][1], options=('Yes', 'No'))
+
+            numpy_rng = system._rng
+            for rng in (numpy_rng, random.Random()):
+                # A random.Random is what the system uses without numpy
+                saved_np = exam_prep.np
+                if isinstance(rng, random.Random):
+                    exam_prep.np = None
+                system._rng = rng
+                try:
+                    answers = system._simulate_answers_bulk(quizzes)
+                    assert system._simulate_answers_bulk([]) == []
+                finally:
+                    exam_prep.np = saved_np
+                    system._rng = numpy_rng
+                assert [len(quiz_answers) for quiz_answers in answers] == [3, 5, 2]
+                for quiz, quiz_answers in zip(quizzes, answers):
+                    for question, answer in zip(quiz['questions'], quiz_answers):
+                        if question['type'] == 'multiple_choice':
+                            assert answer in question['options']
+                        else:
+                            assert answer is None
+            print("   ✓ One answer per question, always one of its options\n")
+        finally:
+            os.chdir(original_cwd)
+
+    return True
+
+def test_rotation_skips_bad_files():
+    """Test that unreadable result files do not stop the others rotating"""
+    print("=" * 60)
+    print("Testing rotation with corrupt result files")
+    print("=" * 60)
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            system = exam_prep.ExamPrepSystem()
+            _write_result(system.progress_dir, 'results_old1.json', 120, 40.0)
+            _write_result(system.progress_dir, 'results_old2.json', 150, 60.0)
+            old = (datetime.now() - timedelta(days=120)).timestamp()
+            bad_files = {
+                'results_truncated.json': '{"quiz_id": "x", "started_',
+                'results_no_date.json': '{"quiz_id": "x"}',
+                'results_bad_date.json': '{"started_at": "last tuesday"}',
+                'results_list.json': '[1, 2]',
+            }
+            for name, content in bad_files.items():
+                path = os.path.join(system.progress_dir, name)
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.utime(path, (old, old))
+
+            assert system._rotate_progress_files() == 2
+            assert system._rotate_progress_files() == 0
+            names = set(os.listdir(system.progress_dir))
+            assert set(bad_files) <= names
+            assert not {'results_old1.json', 'results_old2.json'} & names
+            print("   ✓ Valid old results archived, bad files left in place\n")
+        finally:
+            os.chdir(original_cwd)
+
+    return True
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Simulated Answers", test_simulate_answers_bulk),
+        ("Progress Rotation", test_progress_rotation),
+        ("Rotation With Bad Files", test_rotation_skips_bad_files),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ PASSED: {test_name}\n")
+            else:
+                failed += 1
+                print(f"✗ FAILED: {test_name}\n")
+        except Exception as e:
+            failed += 1
+            print(f"✗ ERROR in {test_name}: {str(e)}\n")
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Test Math Reader
+Verify safe expression evaluation and natural language preprocessing
+"""
+
+import sys
+import os
+import math
+import tempfile
+import types
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_assistant import math_reader, offline_academic
+
+ALLOWED_NAMES = {k: v for k, v in math.__dict__.items() if not k.startswith("__")}
+
+def test_safe_eval_math():
+    """Test evaluation of allowed and rejected expressions"""
+    print("=" * 60)
+    print("Testing safe_eval_math()")
+    print("=" * 60)
+
+    assert math_reader.safe_eval_math("2 + 3 * 4", ALLOWED_NAMES) == 14
+    assert math_reader.safe_eval_math("sqrt(16) + 2 ** 3", ALLOWED_NAMES) == 12.0
+    assert math_reader.safe_eval_math("-(5 // 2) % 3", ALLOWED_NAMES) == 1
+    print("   ✓ Arithmetic and functions evaluated")
+
+    for expression in ["__import__('os')", "open('x')", "(1).real", "unknown + 1",
+                       "[x for x in (1,)]", "sqrt(**{})", "lambda: 1"]:
+        try:
+            math_reader.safe_eval_math(expression, ALLOWED_NAMES)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expression should be rejected: {expression}")
+    print("   ✓ Unsafe expressions rejected\n")
+
+    return True
+
+def test_parse_cache():
+    """Test that repeated and invalid expressions are served from the caches"""
+    print("=" * 60)
+    print("Testing expression caches")
+    print("=" * 60)
+
+    math_reader.safe_eval_math("7 * 6", ALLOWED_NAMES)
+    hits = math_reader._compile_cached.cache_info().hits
+    assert math_reader.safe_eval_math("7 * 6", ALLOWED_NAMES) == 42
+    assert math_reader._compile_cached.cache_info().hits == hits + 1
+    print("   ✓ Compiled expression reused")
+
+    for _ in range(2):
+        try:
+            math_reader.safe_eval_math("2 +", ALLOWED_NAMES)
+        except ValueError as e:
+            assert "Invalid mathematical expression" in str(e)
+        else:
+            raise AssertionError("Incomplete expression should be rejected")
+    hits = math_reader._syntax_error.cache_info().hits
+    try:
+        math_reader.safe_eval_math("2 +", ALLOWED_NAMES)
+    except ValueError:
+        pass
+    assert math_reader._syntax_error.cache_info().hits == hits + 1
+    print("   ✓ Syntax errors cached")
+
+    for expression in (["2 + 2"], {"x": 1}, 42):
+        try:
+            math_reader.safe_eval_math(expression, ALLOWED_NAMES)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{expression!r} should be rejected")
+    print("   ✓ Non-string input rejected with ValueError")
+
+    math_reader._eval_offline("2.5 * 4")
+    hits = math_reader._eval_offline.cache_info().hits
+    assert math_reader._eval_offline("2.5 * 4") == 10
+    assert math_reader._eval_offline.cache_info().hits == hits + 1
+    print("   ✓ Offline results memoized\n")
+
+    return True
+
+def test_preprocess_math_expression():
+    """Test natural language phrases are rewritten to Python syntax"""
+    print("=" * 60)
+    print("Testing preprocess_math_expression()")
+    print("=" * 60)
+
+    assert math_reader.preprocess_math_expression("5 plus 3") == "5+3"
+    assert math_reader.preprocess_math_expression("10 mod 3") == "10%3"
+    assert math_reader.preprocess_math_expression("2 to the power of 8") == "2**8"
+    assert math_reader.preprocess_math_expression("  2   +   2  ") == "2+2"
+    assert math_reader.preprocess_math_expression("two plus three times four") == "2+3*4"
+    assert math_reader.preprocess_math_expression("5x3") == "5*3"
+    assert math_reader.preprocess_math_expression("2x4 plus 1") == "2*4+1"
+    assert math_reader.preprocess_math_expression("exp 1 x 2") == "exp(1)*2"
+    print("   ✓ Phrases rewritten in a single pass")
+
+    assert math_reader.preprocess_math_expression("sqrt(sqrt(16") == "sqrt(sqrt(16))"
+    assert math_reader.preprocess_math_expression("sqrt(4 + 5)") == "sqrt(4+5)"
+    assert math_reader.preprocess_math_expression("square root of 16 plus 9") == "sqrt(16)+9"
+    assert math_reader.preprocess_math_expression("exp 1") == "exp(1)"
+    assert math_reader.preprocess_math_expression("(2 + 3 times (4") == "(2+3*(4))"
+    print("   ✓ Open function calls closed\n")
+
+    return True
+
+def test_solve_math_problem():
+    """Test offline solving, with and without the plain arithmetic fast path"""
+    print("=" * 60)
+    print("Testing solve_math_problem()")
+    print("=" * 60)
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        # No mode flag file here, so problems are solved offline
+        os.chdir(tmp)
+        try:
+            offline_academic.reset_mode_cache()
+            assert math_reader.solve_math_problem("2 + 3 * 4") == "Solution: 14"
+            print("   ✓ Plain arithmetic solved")
+            assert math_reader.solve_math_problem("(2 + 3") == "Solution: 5"
+            assert math_reader.solve_math_problem("5x3") == "Solution: 15"
+            print("   ✓ Unbalanced parentheses closed by preprocessing\n")
+        finally:
+            offline_academic.reset_mode_cache()
+            os.chdir(original_cwd)
+
+    return True
+
+def test_vectorized_evaluation():
+    """Test evaluating one expression over a range of values"""
+    print("=" * 60)
+    print("Testing solve_math_problem_vectorized()")
+    print("=" * 60)
+
+    result = list(math_reader.solve_math_problem_vectorized("x**2 + 1", "x", [0, 1, 2, 3]))
+    assert result == [1.0, 2.0, 5.0, 10.0]
+    result = list(math_reader.solve_math_problem_vectorized("sqrt(x)", "x", [4, -1]))
+    assert result[0] == 2.0 and math.isnan(result[1])
+    print("   ✓ Values evaluated element-wise")
+
+    for expression, var_name in [("y + 1", "x"), ("lambda + 1", "lambda")]:
+        try:
+            math_reader.solve_math_problem_vectorized(expression, var_name, [1])
+        except ValueError:
+            continue
+        raise AssertionError(f"Should be rejected: {expression} over {var_name}")
+    print("   ✓ Unknown names and keywords rejected\n")
+
+    return True
+
+def test_numba_kernel():
+    """Test the JIT-compiled path used for expressions evaluated repeatedly"""
+    print("=" * 60)
+    print("Testing numba kernels")
+    print("=" * 60)
+
+    if math_reader.numba is None or math_reader.np is None:
+        print("   - numba not installed, skipped\n")
+        return True
+
+    kernel = math_reader._numba_kernel("x**2 + sqrt(x)", "x")
+    assert list(kernel(math_reader.np.array([1.0, 4.0]))) == [2.0, 18.0]
+    assert math_reader._numba_kernel("x + 1", "lambda") is None
+    for _ in range(2):
+        result = math_reader.solve_math_problem_vectorized("x * 3", "x", [1, 2])
+        assert list(result) == [3.0, 6.0]
+    print("   ✓ Compiled kernel matches numpy results\n")
+
+    return True
+
+def test_jit_failure_remembered():
+    """Test that an expression numba cannot run is not compiled again"""
+    print("=" * 60)
+    print("Testing failed JIT compiles")
+    print("=" * 60)
+
+    if math_reader.np is None:
+        print("   - numpy not installed, skipped\n")
+        return True
+
+    compiles = []
+    def vectorize(func):
+        def kernel(xs):
+            compiles.append(func)  # numba compiles lazily, on the call
+            raise TypeError("cannot determine Numba type")
+        return kernel
+
+    saved_numba = math_reader.numba
+    math_reader.numba = types.SimpleNamespace(vectorize=vectorize)
+    math_reader._numba_kernel.cache_clear()
+    try:
+        for _ in range(4):
+            result = math_reader.solve_math_problem_vectorized("x * 2 + 1", "x", [1, 2])
+            assert list(result) == [3.0, 5.0]
+        assert len(compiles) == 1
+        assert ("x * 2 + 1", "x") in math_reader._JIT_FAILED
+        print("   ✓ numpy used after one failed kernel call\n")
+    finally:
+        math_reader.numba = saved_numba
+        math_reader._numba_kernel.cache_clear()
+        math_reader._JIT_FAILED.discard(("x * 2 + 1", "x"))
+
+    return True
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Safe Evaluation", test_safe_eval_math),
+        ("Expression Caches", test_parse_cache),
+        ("Preprocessing", test_preprocess_math_expression),
+        ("Solving", test_solve_math_problem),
+        ("Vectorized Evaluation", test_vectorized_evaluation),
+        ("Numba Kernels", test_numba_kernel),
+        ("Failed JIT Compiles", test_jit_failure_remembered),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ PASSED: {test_name}\n")
+            else:
+                failed += 1
+                print(f"✗ FAILED: {test_name}\n")
+        except Exception as e:
+            failed += 1
+            print(f"✗ ERROR in {test_name}: {str(e)}\n")
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
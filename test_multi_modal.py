@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test Multi-Modal Input
+Verify the placeholder message for every kind of input type
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_assistant.multi_modal import process_multimodal_input
+
+PREFIX = "Multi-modal input processing not yet implemented for: "
+
+def test_process_multimodal_input():
+    """Test cached, unhashable and equal-but-different-type input types"""
+    print("=" * 60)
+    print("Testing process_multimodal_input()")
+    print("=" * 60)
+
+    assert process_multimodal_input("voice") == PREFIX + "voice"
+    assert process_multimodal_input("voice") == PREFIX + "voice"
+    print("   ✓ Message for a string input type")
+
+    assert process_multimodal_input({'kind': 'image'}) == PREFIX + "{'kind': 'image'}"
+    assert process_multimodal_input(['text']) == PREFIX + "['text']"
+    print("   ✓ Unhashable input types accepted")
+
+    assert process_multimodal_input(True) == PREFIX + "True"
+    assert process_multimodal_input(1.0) == PREFIX + "1.0"
+    assert process_multimodal_input(1) == PREFIX + "1"
+    print("   ✓ Equal values of different types kept apart\n")
+
+    return True
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Multi-Modal Input", test_process_multimodal_input),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ PASSED: {test_name}\n")
+            else:
+                failed += 1
+                print(f"✗ FAILED: {test_name}\n")
+        except Exception as e:
+            failed += 1
+            print(f"✗ ERROR in {test_name}: {str(e)}\n")
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
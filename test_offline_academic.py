@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Test Offline Academic Data
+Verify the assistant mode flag and offline academic lookups
+"""
+
+import sys
+import os
+import mmap
+import sqlite3
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_assistant import offline_academic
+from ai_assistant import offline_academic_data
+
+def test_mode_flag():
+    """Test that the cached mode follows the flag file"""
+    print("=" * 60)
+    print("Testing get_mode() / set_mode()")
+    print("=" * 60)
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            offline_academic.reset_mode_cache()
+            assert offline_academic.get_mode() == 'offline'
+            print("   ✓ Defaults to offline without a flag file")
+
+            offline_academic.set_mode('online')
+            assert offline_academic.get_mode() == 'online'
+            offline_academic.reset_mode_cache()
+            assert offline_academic.get_mode() == 'online'
+            print("   ✓ Mode persisted to the flag file")
+
+            try:
+                offline_academic.set_mode('sometimes')
+            except ValueError:
+                print("   ✓ Invalid mode rejected")
+            else:
+                raise AssertionError("Invalid mode should be rejected")
+
+            with open(offline_academic.MODE_FLAG_FILE, 'w') as f:
+                f.write('offline\n')
+            assert offline_academic.get_mode() == 'offline'
+            print("   ✓ Flag files written as text still read")
+            offline_academic.set_mode('online')
+            assert offline_academic.get_mode() == 'online'
+            os.remove(offline_academic.MODE_FLAG_FILE)
+            assert offline_academic.get_mode() == 'offline'
+            print("   ✓ Changes to the flag file picked up\n")
+        finally:
+            offline_academic.reset_mode_cache()
+            os.chdir(original_cwd)
+
+    return True
+
+def test_offline_data():
+    """Test lazy loading of the offline academic data and searching it"""
+    print("=" * 60)
+    print("Testing offline_data / offline_search()")
+    print("=" * 60)
+
+    addition = offline_academic.offline_data["basic"]["mathematics"]["addition"]
+    assert addition.startswith("Addition is")
+    assert "basic" in offline_academic.offline_data
+    print("   ✓ Data loaded on first access")
+
+    assert offline_academic.get_entry("basic", "mathematics", "addition") == addition
+    assert offline_academic.lookup("Basic", "MATHEMATICS", " Addition ") == addition
+    assert offline_academic.lookup("basic", "mathematics", "alchemy") is None
+    assert offline_academic.lookup_many([("basic", "mathematics", "addition"), ("basic", "x")]) == [addition, None]
+    assert offline_academic.cache_stats()["get_entry"].hits > 0
+    assert ("basic", "science", "photosynthesis") in offline_academic.topics_with_prefix("Photo")
+    assert offline_academic.topics_with_prefix("zzzz") == []
+    assert addition.endswith("Book: 'Mathematics for Elementary School' by Pearson.")
+    assert "Further reading: https://" in offline_academic.get_entry("counselling", "study tips")
+    parts = offline_academic.get_entry_parts("basic", "mathematics", "addition")
+    assert addition == f"{parts.text} Further reading: {parts.url}; Book: {parts.book}"
+    print("   ✓ Entries rendered with their shared references")
+
+    result = offline_academic.offline_search("Addition")
+    assert result.startswith("[Basic > Mathematics] Addition: Addition is")
+    assert offline_academic.offline_search("zzzz") == "No offline data found for your query."
+    hits = offline_academic.cache_stats()["_offline_search"].hits
+    assert offline_academic.offline_search("  ADDITION ") == result
+    assert offline_academic.cache_stats()["_offline_search"].hits == hits + 1
+    print("   ✓ Search finds topics and reports misses")
+
+    assert offline_academic.ranked_search("photo plants")[0] == ("basic", "science", "photosynthesis")
+    assert offline_academic.offline_search("how do plants make food").startswith("[Basic > Science]")
+    for query in ["who won the world cup", "capital of france"]:
+        assert offline_academic.offline_search(query) == "No offline data found for your query."
+    assert offline_academic.topics_in("Is a food chain like photosynthesis?") == [
+        ("basic", "science", "food chain"), ("basic", "science", "photosynthesis")]
+    print("   ✓ Ranked search matches words and prefixes")
+
+    assert offline_academic.resolve_topic("photosythesis") == ("basic", "science", "photosynthesis")
+    assert offline_academic.offline_search("photosythesis").startswith("[Basic > Science] Photosynthesis:")
+    assert offline_academic.resolve_topic("zzzz") is None
+    print("   ✓ Misspelled topics resolved\n")
+
+    return True
+
+def test_build():
+    """Test that rebuilding replaces the built files instead of rewriting them"""
+    print("=" * 60)
+    print("Testing offline_academic_data.build_pack()")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blob_path = os.path.join(tmp, 'data.blob')
+        index_path = os.path.join(tmp, 'data.marshal')
+        offline_academic_data.build_pack(blob_path, index_path, compress=False)
+        with open(blob_path, 'rb') as f:
+            blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            old_blob = blob[:]
+            old_inode = os.stat(blob_path).st_ino
+            offline_academic_data.build_pack(blob_path, index_path, compress=False)
+            assert os.stat(blob_path).st_ino != old_inode
+            assert blob[:] == old_blob
+        finally:
+            blob.close()
+        assert sorted(os.listdir(tmp)) == ['data.blob', 'data.marshal']
+    print("   ✓ Mapped blob left intact by a rebuild\n")
+
+    return True
+
+def test_search_db_failure():
+    """Test that a search database that cannot be built is not retried"""
+    print("=" * 60)
+    print("Testing search without FTS5")
+    print("=" * 60)
+
+    calls = []
+    def fail(*args, **kwargs):
+        calls.append(args)
+        raise sqlite3.OperationalError("no such module: fts5")
+
+    # A missing database file forces a build, and no sqlite call succeeds
+    saved = (offline_academic._search_db, offline_academic._search_db_failed,
+             offline_academic._DATA_DB, offline_academic._get_store,
+             offline_academic_data.fill_database)
+    offline_academic._search_db = None
+    offline_academic._search_db_failed = False
+    offline_academic._DATA_DB = os.path.join(os.devnull, 'missing.db')
+    offline_academic._get_store = fail
+    offline_academic_data.fill_database = fail
+    try:
+        assert offline_academic.ranked_search("photo plants") == []
+        assert offline_academic.ranked_search("photo plants") == []
+        assert len(calls) == 2  # The failed build and the in-memory fallback, once
+        print("   ✓ Failed build remembered")
+
+        offline_academic.prewarm()
+        print("   ✓ Prewarm failures not raised\n")
+    finally:
+        (offline_academic._search_db, offline_academic._search_db_failed,
+         offline_academic._DATA_DB, offline_academic._get_store,
+         offline_academic_data.fill_database) = saved
+
+    return True
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Mode Flag", test_mode_flag),
+        ("Offline Data", test_offline_data),
+        ("Build", test_build),
+        ("Search Database Failure", test_search_db_failure),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ PASSED: {test_name}\n")
+            else:
+                failed += 1
+                print(f"✗ FAILED: {test_name}\n")
+        except Exception as e:
+            failed += 1
+            print(f"✗ ERROR in {test_name}: {str(e)}\n")
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
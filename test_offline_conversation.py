@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Test Offline Conversation
+Verify intents, response rotation, the Ollama probe and saved sessions
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+import types
+from datetime import timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_assistant import offline_conversation
+from ai_assistant.offline_conversation import OfflineConversationAI, HistoryEntry
+
+def _save_and_load(ai, tmp, name):
+    """Save ai's session to tmp/name and return the parsed file"""
+    path = os.path.join(tmp, name)
+    assert ai.save_conversation_history(path) == f"Conversation saved to {path}"
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def test_save_conversation_history():
+    """Test that a saved session reloads with its turns, times and contexts"""
+    print("=" * 60)
+    print("Testing save_conversation_history()")
+    print("=" * 60)
+
+    ai = OfflineConversationAI()
+    ai.process_conversation("hello", context={1: 'one', 'page': 2})
+    ai.process_conversation("thanks")
+    assert all(isinstance(item, HistoryEntry) for item in ai.conversation_history)
+    assert not hasattr(ai.conversation_history[0], '__dict__')
+    print("   ✓ Turns kept as slotted HistoryEntry records")
+
+    # Offsets from the session start are turned back into wall-clock times
+    ai.conversation_history[0].elapsed_ns = 1_500_000_000
+    ai.conversation_history[1].elapsed_ns = 62_000_250_000
+    session_start = ai.user_context['session_start']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data = _save_and_load(ai, tmp, "session.json")
+        first, second = data['conversation_history']
+        assert first['timestamp'] == (session_start + timedelta(seconds=1.5)).isoformat()
+        assert second['timestamp'] == (session_start + timedelta(seconds=62, microseconds=250)).isoformat()
+        assert data['user_context']['session_start'] == session_start.isoformat()
+        print("   ✓ Timestamps rebuilt from monotonic offsets")
+
+        assert first['user'] == "hello" and first['ai_response'] == ai.conversation_history[0].ai_response
+        assert first['context'] == {'1': 'one', 'page': 2}
+        assert second['user'] == "thanks" and second['context'] is None
+        assert data['summary']['total_exchanges'] == 2
+        print("   ✓ Turns and contexts (non-str keys included) saved")
+
+        # A writer that rejects the data leaves the json fallback to save it
+        def reject(data, option=None):
+            raise TypeError("Dict key must be str")
+        saved_orjson = offline_conversation.orjson
+        offline_conversation.orjson = types.SimpleNamespace(
+            dumps=reject, OPT_INDENT_2=0, OPT_NON_STR_KEYS=0)
+        try:
+            fallback = _save_and_load(ai, tmp, "fallback.json")
+        finally:
+            offline_conversation.orjson = saved_orjson
+        # Only the session duration in the summary moves between saves
+        assert fallback['conversation_history'] == data['conversation_history']
+        assert fallback['user_context'] == data['user_context']
+        print("   ✓ Falls back to json when orjson cannot encode\n")
+
+    return True
+
+def test_analyze_intent():
+    """Test that each keyword group maps to its intent"""
+    print("=" * 60)
+    print("Testing _analyze_intent()")
+    print("=" * 60)
+
+    ai = OfflineConversationAI()
+    # Inputs avoid keywords of higher priority intents ('hi' in 'this', 'how' in 'show')
+    cases = [
+        ("Good morning", 'greeting'),
+        ("When is it due", 'question'),
+        ("Please assist", 'help_request'),
+        ("Define a noun", 'academic_query'),
+        ("Solve 2 + 2", 'math_problem'),
+        ("Quiz me", 'study_help'),
+        ("My name is Ada", 'personal'),
+        ("Thanks a lot", 'gratitude'),
+        ("Bye", 'goodbye'),
+        ("I feel sad", 'emotional'),
+        ("Repeat please", 'clarification'),
+        ("Too difficult", 'encouragement_needed'),
+        ("Pizza", 'general'),
+    ]
+    for user_input, intent in cases:
+        assert ai._analyze_intent(user_input) == intent, user_input
+    assert [intent for intent, _ in offline_conversation._INTENTS] == [intent for _, intent in cases[:-1]]
+    print("   ✓ Every keyword group recognised")
+
+    assert ai._analyze_intent("Hello, what is this?") == 'greeting'
+    assert ai._analyze_intent("Thanks, bye") == 'gratitude'
+    print("   ✓ Earlier intents take priority\n")
+
+    return True
+
+def test_response_cycles():
+    """Test that every response in a bucket is used before any repeats"""
+    print("=" * 60)
+    print("Testing response rotation")
+    print("=" * 60)
+
+    ai = OfflineConversationAI()
+    buckets = [
+        (ai._greetings, offline_conversation._GREETINGS),
+        (ai._help_responses, offline_conversation._HELP_RESPONSES),
+        (ai._study_tips, offline_conversation._STUDY_TIPS),
+        (ai._study_encouragements, offline_conversation._STUDY_ENCOURAGEMENTS),
+        (ai._gratitude_responses, offline_conversation._GRATITUDE_RESPONSES),
+        (ai._goodbyes, offline_conversation._GOODBYES),
+        (ai._encouragements, offline_conversation._ENCOURAGEMENTS),
+        (ai._general_responses, offline_conversation._GENERAL_RESPONSES),
+    ]
+    for cycle, responses in buckets:
+        first_round = [next(cycle) for _ in responses]
+        assert sorted(first_round) == sorted(responses)
+        assert [next(cycle) for _ in responses] == first_round
+    print("   ✓ Buckets cycled without early repeats")
+
+    ai = OfflineConversationAI()
+    thanks = [ai._handle_gratitude() for _ in offline_conversation._GRATITUDE_RESPONSES]
+    assert sorted(thanks) == sorted(offline_conversation._GRATITUDE_RESPONSES)
+    print("   ✓ Handlers draw from their bucket\n")
+
+    return True
+
+def test_ollama_probe():
+    """Test that construction does not wait on the Ollama status probe"""
+    print("=" * 60)
+    print("Testing background Ollama probe")
+    print("=" * 60)
+
+    release = threading.Event()
+    probed = threading.Event()
+    def get_ollama_status():
+        release.wait(5)
+        probed.set()
+        return {"ready_for_offline": True}
+
+    saved = offline_conversation.OLLAMA_AVAILABLE, offline_conversation.ollama_integration
+    offline_conversation.OLLAMA_AVAILABLE = True
+    offline_conversation.ollama_integration = types.SimpleNamespace(get_ollama_status=get_ollama_status)
+    try:
+        start = time.perf_counter()
+        ai = OfflineConversationAI()
+        assert time.perf_counter() - start < 1
+        assert ai.ollama_ready is False
+        print("   ✓ Constructed while the probe is pending")
+
+        release.set()
+        assert probed.wait(5)
+        deadline = time.perf_counter() + 5
+        while not ai.ollama_ready and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        assert ai.ollama_ready is True
+        print("   ✓ Probe result applied when it arrives\n")
+    finally:
+        release.set()
+        offline_conversation.OLLAMA_AVAILABLE, offline_conversation.ollama_integration = saved
+
+    return True
+
+def main():
+    """Run all tests"""
+    tests = [
+        ("Save Conversation", test_save_conversation_history),
+        ("Intent Analysis", test_analyze_intent),
+        ("Response Cycles", test_response_cycles),
+        ("Ollama Probe", test_ollama_probe),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ PASSED: {test_name}\n")
+            else:
+                failed += 1
+                print(f"✗ FAILED: {test_name}\n")
+        except Exception as e:
+            failed += 1
+            print(f"✗ ERROR in {test_name}: {str(e)}\n")
+
+    print("=" * 60)
+    print(f"Test Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)